@@ -0,0 +1,84 @@
+"""Store run and result ids as native UUIDs.
+
+SQLite has no UUID type, so ``sa.Uuid`` stores 32-char hex without dashes;
+the existing dashed ``str(uuid4())`` values are rewritten to match before the
+columns are retyped. PostgreSQL casts the dashed strings directly.
+
+Revision ID: 13e5d38cf872
+Revises: bcb4cc3c192f
+Create Date: 2026-10-15 09:05:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "13e5d38cf872"
+down_revision: str | None = "bcb4cc3c192f"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_ID_COLUMNS = {
+    "benchmark_runs": ("id",),
+    "benchmark_results": ("id", "benchmark_run_id"),
+}
+_RESULTS_RUN_FK = "benchmark_results_benchmark_run_id_fkey"
+
+
+def _dashed(column: str) -> str:
+    """SQLite expression turning a 32-char hex uuid back into the 8-4-4-4-12 form."""
+    return (
+        f"substr({column}, 1, 8) || '-' || substr({column}, 9, 4) || '-' || "
+        f"substr({column}, 13, 4) || '-' || substr({column}, 17, 4) || '-' || "
+        f"substr({column}, 21)"
+    )
+
+
+def _retype(old: sa.types.TypeEngine, new: sa.types.TypeEngine, cast: str) -> None:
+    """Retype every id column from ``old`` to ``new``; ``cast`` is the PostgreSQL USING type."""
+    if op.get_bind().dialect.name == "sqlite":
+        for table, columns in _ID_COLUMNS.items():
+            with op.batch_alter_table(table) as batch_op:
+                for column in columns:
+                    batch_op.alter_column(column, existing_type=old, type_=new)
+        return
+
+    op.drop_constraint(_RESULTS_RUN_FK, "benchmark_results", type_="foreignkey")
+    for table, columns in _ID_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                existing_type=old,
+                type_=new,
+                postgresql_using=f"{column}::{cast}",
+            )
+    op.create_foreign_key(
+        _RESULTS_RUN_FK,
+        "benchmark_results",
+        "benchmark_runs",
+        ["benchmark_run_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    if op.get_bind().dialect.name == "sqlite":
+        for table, columns in _ID_COLUMNS.items():
+            for column in columns:
+                op.execute(f"UPDATE {table} SET {column} = replace({column}, '-', '')")
+    _retype(sa.String(36), sa.Uuid(), "uuid")
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    _retype(sa.Uuid(), sa.String(36), "text")
+    if op.get_bind().dialect.name == "sqlite":
+        for table, columns in _ID_COLUMNS.items():
+            for column in columns:
+                op.execute(f"UPDATE {table} SET {column} = {_dashed(column)}")
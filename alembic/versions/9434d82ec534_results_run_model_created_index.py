@@ -0,0 +1,34 @@
+"""Index benchmark_results on (benchmark_run_id, model_name, created_at).
+
+``create_all`` only adds indexes when it creates the table, so databases whose
+``benchmark_results`` table already existed need this revision to get it.
+
+Revision ID: 9434d82ec534
+Revises: 13e5d38cf872
+Create Date: 2026-10-15 09:10:00.000000
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9434d82ec534"
+down_revision: str | None = "13e5d38cf872"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_index(
+        "ix_results_run_model_created",
+        "benchmark_results",
+        ["benchmark_run_id", "model_name", "created_at"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index("ix_results_run_model_created", table_name="benchmark_results")
@@ -0,0 +1,64 @@
+"""Baseline schema with String(36) ids.
+
+This is the schema ``init_db`` created before the project shipped migrations.
+Databases created that way have no ``alembic_version`` table; mark them with
+``alembic stamp bcb4cc3c192f`` before running ``alembic upgrade head``.
+
+Revision ID: bcb4cc3c192f
+Revises:
+Create Date: 2026-10-15 09:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "bcb4cc3c192f"
+down_revision: str | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_table(
+        "benchmark_runs",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text()),
+        sa.Column("status", sa.String(20)),
+        sa.Column("prompt_suite", sa.String(50), nullable=False),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+    )
+    op.create_table(
+        "benchmark_results",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column(
+            "benchmark_run_id",
+            sa.String(36),
+            sa.ForeignKey("benchmark_runs.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("model_name", sa.String(100), nullable=False),
+        sa.Column("provider", sa.String(50), nullable=False),
+        sa.Column("api_base_url", sa.String(500)),
+        sa.Column("prompt_category", sa.String(50), nullable=False),
+        sa.Column("prompt_text", sa.Text(), nullable=False),
+        sa.Column("response_text", sa.Text()),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("latency_ms", sa.Float(), nullable=True),
+        sa.Column("prompt_tokens", sa.Integer(), nullable=True),
+        sa.Column("completion_tokens", sa.Integer(), nullable=True),
+        sa.Column("total_tokens", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime()),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_table("benchmark_results")
+    op.drop_table("benchmark_runs")
@@ -1,11 +1,17 @@
 """Anthropic adapter — talks to the Anthropic Messages API."""
 
 import time
+from functools import lru_cache
 
 import httpx
+import orjson
 
 from src.adapters.base import CompletionResponse, ModelAdapter
 
+# Bound once so complete() skips the module attribute lookup on every call
+_perf_counter_ns = time.perf_counter_ns
+_RequestError = httpx.RequestError
+
 
 class AnthropicAdapter(ModelAdapter):
     """Adapter for the Anthropic Messages API."""
@@ -22,6 +28,7 @@ class AnthropicAdapter(ModelAdapter):
     ) -> None:
         base = api_base_url or self.DEFAULT_BASE_URL
         super().__init__(model_name, api_key, base, timeout)
+        self._messages_url = f"{self.api_base_url}/v1/messages"
 
     def _build_headers(self) -> dict[str, str]:
         """Build Anthropic-specific headers."""
@@ -41,33 +48,39 @@ class AnthropicAdapter(ModelAdapter):
         Returns:
             Standardized CompletionResponse.
         """
-        payload = _build_payload(self.model_name, prompt, system_prompt)
+        content = _encode_payload(self.model_name, prompt, system_prompt)
         client = await self._get_client()
-        start = time.perf_counter()
+        start = _perf_counter_ns()
 
         try:
-            response = await client.post(
-                f"{self.api_base_url}/v1/messages",
-                json=payload,
-            )
-            latency_ms = (time.perf_counter() - start) * 1000
-            response.raise_for_status()
-            data = response.json()
-            return _parse_anthropic_response(data, latency_ms)
-        except httpx.HTTPStatusError as exc:
-            latency_ms = (time.perf_counter() - start) * 1000
+            async with client.stream(
+                "POST",
+                self._messages_url,
+                content=content,
+                headers=self._headers,
+            ) as response:
+                body = await response.aread()
+        except _RequestError as exc:
             return CompletionResponse(
                 text="",
-                latency_ms=latency_ms,
-                error=f"HTTP {exc.response.status_code}: {exc.response.text}",
+                latency_ms=(_perf_counter_ns() - start) / 1_000_000,
+                error=f"Request failed: {exc}",
             )
-        except httpx.RequestError as exc:
-            latency_ms = (time.perf_counter() - start) * 1000
+
+        latency_ms = (_perf_counter_ns() - start) / 1_000_000
+        if response.is_error:
             return CompletionResponse(
                 text="",
                 latency_ms=latency_ms,
-                error=f"Request failed: {exc}",
+                error=f"HTTP {response.status_code}: {response.text}",
             )
+        return _parse_anthropic_response(orjson.loads(body), latency_ms)
+
+
+@lru_cache(maxsize=512)
+def _encode_payload(model: str, prompt: str, system_prompt: str) -> bytes:
+    """Serialize the Messages API payload (cached — suites resend identical prompts)."""
+    return orjson.dumps(_build_payload(model, prompt, system_prompt))
 
 
 def _build_payload(model: str, prompt: str, system_prompt: str) -> dict:
@@ -85,9 +98,8 @@ def _build_payload(model: str, prompt: str, system_prompt: str) -> dict:
 def _parse_anthropic_response(data: dict, latency_ms: float) -> CompletionResponse:
     """Parse an Anthropic Messages API response."""
     content_blocks = data.get("content", [])
-    text = "".join(
-        block.get("text", "") for block in content_blocks if block.get("type") == "text"
-    )
+    text_parts = [block.get("text", "") for block in content_blocks if block.get("type") == "text"]
+    text = "".join(text_parts)
     usage = data.get("usage", {})
 
     return CompletionResponse(
@@ -1,12 +1,30 @@
 """Abstract base adapter defining the interface all AI provider adapters must implement."""
 
+import asyncio
+import logging
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from contextlib import nullcontext
 from dataclasses import dataclass
+from functools import cached_property
 
 import httpx
 
+logger = logging.getLogger(__name__)
 
-@dataclass(frozen=True)
+# Process-wide connection pools, keyed by (base URL, timeout) so that every adapter
+# talking to the same endpoint reuses warm connections regardless of model or API key.
+# Auth headers are sent per request, never stored on the shared client.
+_CLIENT_REGISTRY: dict[tuple[str, int], httpx.AsyncClient] = {}
+
+_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=100,
+    max_connections=200,
+    keepalive_expiry=60,
+)
+
+
+@dataclass(frozen=True, slots=True)
 class CompletionResponse:
     """Standardized response from any AI model adapter."""
 
@@ -24,6 +42,10 @@ class CompletionResponse:
         return self.error is not None
 
 
+# Placeholder for batch slots that have not been filled yet
+_NOT_SENT = CompletionResponse(text="", error="Not sent")
+
+
 class ModelAdapter(ABC):
     """Abstract base class for AI model adapters.
 
@@ -42,16 +64,24 @@ class ModelAdapter(ABC):
         self.api_key = api_key
         self.api_base_url = api_base_url.rstrip("/")
         self.timeout = timeout
-        self._client: httpx.AsyncClient | None = None
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the shared HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
+        """Get or create the pooled HTTP client for this adapter's endpoint."""
+        key = (self.api_base_url, self.timeout)
+        client = _CLIENT_REGISTRY.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=True,
                 timeout=httpx.Timeout(self.timeout),
-                headers=self._build_headers(),
+                limits=_POOL_LIMITS,
             )
-        return self._client
+            _CLIENT_REGISTRY[key] = client
+        return client
+
+    @cached_property
+    def _headers(self) -> dict[str, str]:
+        """Provider headers, built once on first use after subclass init has run."""
+        return self._build_headers()
 
     @abstractmethod
     def _build_headers(self) -> dict[str, str]:
@@ -69,13 +99,72 @@ class ModelAdapter(ABC):
             A CompletionResponse with the model's reply and metadata.
         """
 
-    async def close(self) -> None:
-        """Close the underlying HTTP client."""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+    async def batch_complete(
+        self,
+        prompts: Sequence[str],
+        max_in_flight: int = 5,
+        system_prompt: str = "",
+        request_slots: asyncio.Semaphore | None = None,
+    ) -> list[CompletionResponse]:
+        """Send several prompts to this model and return responses in prompt order.
+
+        Up to ``max_in_flight`` requests are multiplexed over the pooled client at
+        once. A prompt whose call raises yields an error response instead of
+        failing the whole batch. Providers with a native batch API may override this.
+
+        Args:
+            prompts: The user messages to send.
+            max_in_flight: Maximum concurrent requests for this batch.
+            system_prompt: Optional system instruction applied to every prompt.
+            request_slots: Optional semaphore shared with other batches; each
+                request holds a slot while in flight, bounding the combined total.
+
+        Returns:
+            One CompletionResponse per prompt, in the same order.
+        """
+        limit = request_slots or nullcontext()
+        responses = [_NOT_SENT] * len(prompts)
+        pending = iter(enumerate(prompts))
+
+        async def _drain() -> None:
+            for index, prompt in pending:
+                async with limit:
+                    responses[index] = await self._safe_complete(prompt, system_prompt)
+
+        async with asyncio.TaskGroup() as group:
+            for _ in range(min(max_in_flight, len(prompts))):
+                group.create_task(_drain())
+        return responses
+
+    async def _safe_complete(self, prompt: str, system_prompt: str) -> CompletionResponse:
+        """Call complete(), converting unexpected exceptions into an error response."""
+        try:
+            return await self.complete(prompt, system_prompt)
+        except Exception as exc:
+            logger.warning("Adapter error for %s: %s", self.model_name, exc)
+            return CompletionResponse(text="", error=str(exc))
+
+    async def close(self) -> None:  # noqa: B027
+        """Release the adapter.
+
+        Intentionally a no-op hook that subclasses holding their own resources
+        may override. The pooled HTTP client is shared with other adapters and
+        stays open; it is closed on application shutdown by ``close_shared_clients``.
+        """
 
     async def __aenter__(self) -> "ModelAdapter":
+        """Create the endpoint's pooled client before the first request goes out."""
+        await self._get_client()
         return self
 
     async def __aexit__(self, *args: object) -> None:
         await self.close()
+
+
+async def close_shared_clients() -> None:
+    """Close every pooled HTTP client (call once on application shutdown)."""
+    clients = list(_CLIENT_REGISTRY.values())
+    _CLIENT_REGISTRY.clear()
+    for client in clients:
+        if not client.is_closed:
+            await client.aclose()
@@ -1,17 +1,18 @@
 """Factory for creating model adapters from configuration."""
 
-from src.adapters.anthropic_adapter import AnthropicAdapter
+import importlib
+
 from src.adapters.base import ModelAdapter
-from src.adapters.generic_adapter import GenericAdapter
-from src.adapters.openai_adapter import OpenAIAdapter
-from src.config import get_settings
+from src.config import Settings, get_settings
 from src.schemas.result import ModelConfig
 
-_ADAPTER_MAP: dict[str, type[ModelAdapter]] = {
-    "openai": OpenAIAdapter,
-    "anthropic": AnthropicAdapter,
-    "generic": GenericAdapter,
+# Adapter classes are imported on first use: (module path, class name) per protocol
+_ADAPTER_PATHS: dict[str, tuple[str, str]] = {
+    "openai": ("src.adapters.openai_adapter", "OpenAIAdapter"),
+    "anthropic": ("src.adapters.anthropic_adapter", "AnthropicAdapter"),
+    "generic": ("src.adapters.generic_adapter", "GenericAdapter"),
 }
+_resolved_adapters: dict[str, type[ModelAdapter]] = {}
 
 # Default protocol for each provider (used when ModelConfig.protocol is empty)
 _DEFAULT_PROTOCOL: dict[str, str] = {
@@ -36,10 +37,10 @@ def create_adapter(config: ModelConfig, timeout: int | None = None) -> ModelAdap
         ValueError: If the provider is not recognized.
     """
     protocol = config.protocol or _DEFAULT_PROTOCOL.get(config.provider, "openai")
-    adapter_cls = _ADAPTER_MAP.get(protocol)
-    if adapter_cls is None:
-        msg = f"Unknown protocol: {protocol!r}. Choose from: {list(_ADAPTER_MAP.keys())}"
+    if protocol not in _ADAPTER_PATHS:
+        msg = f"Unknown protocol: {protocol!r}. Choose from: {list(_ADAPTER_PATHS.keys())}"
         raise ValueError(msg)
+    adapter_cls = _load_adapter_class(protocol)
 
     settings = get_settings()
     api_key = _resolve_api_key(config, settings)
@@ -54,25 +55,36 @@ def create_adapter(config: ModelConfig, timeout: int | None = None) -> ModelAdap
     )
 
 
-def _resolve_api_key(config: ModelConfig, settings: object) -> str:
+def _load_adapter_class(protocol: str) -> type[ModelAdapter]:
+    """Import and cache the adapter class registered for a protocol."""
+    adapter_cls = _resolved_adapters.get(protocol)
+    if adapter_cls is None:
+        module_path, class_name = _ADAPTER_PATHS[protocol]
+        adapter_cls = getattr(importlib.import_module(module_path), class_name)
+        _resolved_adapters[protocol] = adapter_cls
+    return adapter_cls
+
+
+def _resolve_api_key(config: ModelConfig, settings: Settings) -> str:
     """Resolve the API key from config or fall back to environment settings."""
     if config.api_key:
         return config.api_key
 
-    key_map: dict[str, str] = {
-        "openai": getattr(settings, "openai_api_key", ""),
-        "anthropic": getattr(settings, "anthropic_api_key", ""),
-        "suspect": getattr(settings, "suspect_api_key", ""),
-        "generic": "",
-    }
-    return key_map.get(config.provider, "")
+    provider = config.provider
+    if provider == "openai":
+        return settings.openai_api_key
+    if provider == "anthropic":
+        return settings.anthropic_api_key
+    if provider == "suspect":
+        return settings.suspect_api_key
+    return ""
 
 
-def _resolve_base_url(config: ModelConfig, settings: object) -> str:
+def _resolve_base_url(config: ModelConfig, settings: Settings) -> str:
     """Resolve the base URL from config or fall back to environment settings."""
     if config.api_base_url:
         return config.api_base_url
 
     if config.provider == "suspect":
-        return getattr(settings, "suspect_api_base_url", "")
+        return settings.suspect_api_base_url
     return ""
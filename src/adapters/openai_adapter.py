@@ -1,11 +1,17 @@
 """OpenAI adapter — talks to the official OpenAI API."""
 
 import time
+from functools import lru_cache
 
 import httpx
+import orjson
 
 from src.adapters.base import CompletionResponse, ModelAdapter
 
+# Bound once so complete() skips the module attribute lookup on every call
+_perf_counter_ns = time.perf_counter_ns
+_RequestError = httpx.RequestError
+
 
 class OpenAIAdapter(ModelAdapter):
     """Adapter for the official OpenAI Chat Completions API."""
@@ -21,6 +27,7 @@ class OpenAIAdapter(ModelAdapter):
     ) -> None:
         base = api_base_url or self.DEFAULT_BASE_URL
         super().__init__(model_name, api_key, base, timeout)
+        self._completions_url = f"{self.api_base_url}/chat/completions"
 
     def _build_headers(self) -> dict[str, str]:
         """Build OpenAI-style Bearer token headers."""
@@ -39,35 +46,39 @@ class OpenAIAdapter(ModelAdapter):
         Returns:
             Standardized CompletionResponse.
         """
-        messages = _build_messages(prompt, system_prompt)
-        payload = {"model": self.model_name, "messages": messages}
-
+        content = _encode_payload(self.model_name, prompt, system_prompt)
         client = await self._get_client()
-        start = time.perf_counter()
+        start = _perf_counter_ns()
 
         try:
-            response = await client.post(
-                f"{self.api_base_url}/chat/completions",
-                json=payload,
-            )
-            latency_ms = (time.perf_counter() - start) * 1000
-            response.raise_for_status()
-            data = response.json()
-            return _parse_openai_response(data, latency_ms)
-        except httpx.HTTPStatusError as exc:
-            latency_ms = (time.perf_counter() - start) * 1000
+            async with client.stream(
+                "POST",
+                self._completions_url,
+                content=content,
+                headers=self._headers,
+            ) as response:
+                body = await response.aread()
+        except _RequestError as exc:
             return CompletionResponse(
                 text="",
-                latency_ms=latency_ms,
-                error=f"HTTP {exc.response.status_code}: {exc.response.text}",
+                latency_ms=(_perf_counter_ns() - start) / 1_000_000,
+                error=f"Request failed: {exc}",
             )
-        except httpx.RequestError as exc:
-            latency_ms = (time.perf_counter() - start) * 1000
+
+        latency_ms = (_perf_counter_ns() - start) / 1_000_000
+        if response.is_error:
             return CompletionResponse(
                 text="",
                 latency_ms=latency_ms,
-                error=f"Request failed: {exc}",
+                error=f"HTTP {response.status_code}: {response.text}",
             )
+        return _parse_openai_response(orjson.loads(body), latency_ms)
+
+
+@lru_cache(maxsize=512)
+def _encode_payload(model: str, prompt: str, system_prompt: str) -> bytes:
+    """Serialize the chat completion payload (cached — suites resend identical prompts)."""
+    return orjson.dumps({"model": model, "messages": _build_messages(prompt, system_prompt)})
 
 
 def _build_messages(prompt: str, system_prompt: str) -> list[dict[str, str]]:
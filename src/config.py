@@ -1,5 +1,6 @@
 """Centralized application configuration using pydantic-settings."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -36,6 +37,7 @@ class Settings(BaseSettings):
         return Path(raw)
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Create and return a Settings instance (cached at call site via Depends)."""
+    """Return the process-wide Settings instance, parsed from the environment once."""
     return Settings()
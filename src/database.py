@@ -2,6 +2,7 @@
 
 from collections.abc import AsyncGenerator
 
+from sqlalchemy import Connection, String, event, inspect
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -23,6 +24,25 @@ engine = create_async_engine(
     echo=_settings.log_level == "DEBUG",
 )
 
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection: object, _connection_record: object) -> None:
+    """Switch SQLite to WAL with relaxed fsyncs and a 64 MiB page cache."""
+    cursor = dbapi_connection.cursor()  # type: ignore[attr-defined]
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+if engine.dialect.name == "sqlite":
+    event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+
 async_session_factory = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -30,6 +50,11 @@ async_session_factory = async_sessionmaker(
 )
 
 
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Return the session factory, for services that open their own sessions."""
+    return async_session_factory
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Yield an async database session, rolling back on error."""
     async with async_session_factory() as session:
@@ -41,7 +66,37 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
+class OutdatedSchemaError(RuntimeError):
+    """The database predates a migration the ORM models depend on."""
+
+
+def verify_schema(connection: Connection) -> None:
+    """Refuse a database still carrying the pre-UUID ``String(36)`` id columns.
+
+    Raises:
+        OutdatedSchemaError: If ``benchmark_runs.id`` is still a 36-char string.
+    """
+    inspector = inspect(connection)
+    if not inspector.has_table("benchmark_runs"):
+        return
+    id_type = next(
+        column["type"]
+        for column in inspector.get_columns("benchmark_runs")
+        if column["name"] == "id"
+    )
+    if isinstance(id_type, String) and id_type.length == 36:
+        raise OutdatedSchemaError(
+            "benchmark_runs.id is still String(36); run `alembic stamp bcb4cc3c192f` "
+            "and `alembic upgrade head` (see README, Upgrading an existing database)"
+        )
+
+
 async def init_db() -> None:
-    """Create all tables (for development; use Alembic in production)."""
+    """Create all tables (for development; use Alembic in production).
+
+    Raises:
+        OutdatedSchemaError: If the database needs ``alembic upgrade head`` first.
+    """
     async with engine.begin() as conn:
+        await conn.run_sync(verify_schema)
         await conn.run_sync(Base.metadata.create_all)
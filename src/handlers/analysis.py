@@ -1,9 +1,10 @@
 """Deep analysis API handler — run full fraud detection analysis."""
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.database import get_session
+from src.config import Settings, get_settings
+from src.database import get_session_factory
 from src.schemas.analysis import DeepAnalysisReport, DeepAnalysisRequest
 from src.services.deep_analysis import DeepAnalysisService
 
@@ -13,7 +14,8 @@ router = APIRouter(prefix="/analysis", tags=["analysis"])
 @router.post("/deep", response_model=DeepAnalysisReport)
 async def run_deep_analysis(
     request: DeepAnalysisRequest,
-    session: AsyncSession = Depends(get_session),
+    settings: Settings = Depends(get_settings),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
 ) -> DeepAnalysisReport:
     """Run a comprehensive deep analysis against suspect model endpoints.
 
@@ -23,10 +25,11 @@ async def run_deep_analysis(
 
     Args:
         request: Analysis configuration with model endpoints and suites.
-        session: Database session (injected).
+        settings: Application settings (injected).
+        session_factory: Session factory for the concurrent suite runs (injected).
 
     Returns:
         DeepAnalysisReport with per-model reports, comparisons, red flags, and verdict.
     """
-    service = DeepAnalysisService(session)
+    service = DeepAnalysisService(session_factory, max_concurrent=settings.max_concurrent_calls)
     return await service.analyze(request)
@@ -1,12 +1,14 @@
 """Benchmark run API handlers — create, list, and inspect benchmark runs."""
 
+import uuid
+
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import Settings, get_settings
 from src.database import get_session
 from src.schemas.benchmark import BenchmarkRunCreate, BenchmarkRunResponse
-from src.services.benchmark_runner import BenchmarkRunnerService
+from src.services.benchmark_runner import BenchmarkRunnerService, build_run_response
 
 router = APIRouter(prefix="/benchmarks", tags=["benchmarks"])
 
@@ -36,42 +38,22 @@ async def list_benchmarks(
     from src.repositories.benchmark_repo import BenchmarkRepository
 
     repo = BenchmarkRepository(session)
-    runs = await repo.list_all(limit=limit, offset=offset)
-    return [
-        BenchmarkRunResponse(
-            id=run.id,
-            name=run.name,
-            description=run.description,
-            status=run.status,
-            prompt_suite=run.prompt_suite,
-            created_at=run.created_at,
-            completed_at=run.completed_at,
-            result_count=len(run.results) if hasattr(run, "results") and run.results else 0,
-        )
-        for run in runs
-    ]
+    runs = await repo.list_with_result_counts(limit=limit, offset=offset)
+    return [build_run_response(run, result_count) for run, result_count in runs]
 
 
 @router.get("/{run_id}", response_model=BenchmarkRunResponse)
 async def get_benchmark(
-    run_id: str,
+    run_id: uuid.UUID,
     session: AsyncSession = Depends(get_session),
 ) -> BenchmarkRunResponse:
     """Get a specific benchmark run by ID."""
     from src.repositories.benchmark_repo import BenchmarkRepository
 
     repo = BenchmarkRepository(session)
-    run = await repo.get_by_id(run_id)
-    if run is None:
+    found = await repo.get_with_result_count(run_id)
+    if found is None:
         raise HTTPException(status_code=404, detail=f"Benchmark run {run_id!r} not found")
 
-    return BenchmarkRunResponse(
-        id=run.id,
-        name=run.name,
-        description=run.description,
-        status=run.status,
-        prompt_suite=run.prompt_suite,
-        created_at=run.created_at,
-        completed_at=run.completed_at,
-        result_count=len(run.results) if run.results else 0,
-    )
+    run, result_count = found
+    return build_run_response(run, result_count)
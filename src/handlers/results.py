@@ -1,5 +1,7 @@
 """Results & comparison API handlers."""
 
+import uuid
+
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,7 +16,7 @@ router = APIRouter(prefix="/results", tags=["results"])
 
 @router.get("/{run_id}", response_model=list[BenchmarkResultResponse])
 async def get_results(
-    run_id: str,
+    run_id: uuid.UUID,
     model_name: str | None = None,
     session: AsyncSession = Depends(get_session),
 ) -> list[BenchmarkResultResponse]:
@@ -57,7 +59,7 @@ async def compare_runs(
 
 @router.get("/{run_id}/fingerprint")
 async def get_fingerprint(
-    run_id: str,
+    run_id: uuid.UUID,
     model_name: str | None = None,
     session: AsyncSession = Depends(get_session),
 ) -> dict[str, object]:
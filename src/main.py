@@ -2,25 +2,40 @@
 
 import logging
 from contextlib import asynccontextmanager
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
+from typing import Any
 
+import orjson
 import structlog
 from fastapi import FastAPI
 
+from src.adapters.base import close_shared_clients
+from src.config import get_settings
 from src.database import init_db
 from src.handlers.analysis import router as analysis_router
 from src.handlers.benchmarks import router as benchmarks_router
 from src.handlers.results import router as results_router
 
 
+def _orjson_dumps(obj: object, *, default: Callable[[Any], Any] | None = None) -> str:
+    """Serialize a log event with orjson (structlog passes a ``default`` fallback)."""
+    return orjson.dumps(obj, default=default).decode()
+
+
 def _configure_logging() -> None:
-    """Set up structlog with standard library integration."""
+    """Set up structlog — pretty console output in DEBUG, JSON lines otherwise."""
+    renderer: structlog.types.Processor
+    if get_settings().log_level == "DEBUG":
+        renderer = structlog.dev.ConsoleRenderer()
+    else:
+        renderer = structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+
     structlog.configure(
         processors=[
             structlog.contextvars.merge_contextvars,
             structlog.processors.add_log_level,
             structlog.processors.StackInfoRenderer(),
-            structlog.dev.ConsoleRenderer(),
+            renderer,
         ],
         wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
         context_class=dict,
@@ -31,10 +46,11 @@ def _configure_logging() -> None:
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
-    """Application lifespan — initialize DB on startup."""
+    """Application lifespan — initialize DB on startup, close HTTP pools on shutdown."""
     _configure_logging()
     await init_db()
     yield
+    await close_shared_clients()
 
 
 app = FastAPI(
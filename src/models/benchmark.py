@@ -3,7 +3,7 @@
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import DateTime, String, Text
+from sqlalchemy import DateTime, String, Text, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database import Base
@@ -14,10 +14,10 @@ class BenchmarkRun(Base):
 
     __tablename__ = "benchmark_runs"
 
-    id: Mapped[str] = mapped_column(
-        String(36),
+    id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=uuid.uuid4,
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str] = mapped_column(Text, default="")
@@ -44,6 +44,9 @@ class BenchmarkRun(Base):
         "BenchmarkResult",
         back_populates="benchmark_run",
         cascade="all, delete-orphan",
+        # Results can number in the thousands; load them only via an explicit
+        # selectinload so an accidental attribute access fails loudly.
+        lazy="raise",
     )
 
     def __repr__(self) -> str:
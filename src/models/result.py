@@ -3,7 +3,7 @@
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, Text, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database import Base
@@ -13,14 +13,21 @@ class BenchmarkResult(Base):
     """One prompt-response pair from a benchmark run."""
 
     __tablename__ = "benchmark_results"
+    __table_args__ = (
+        # Leading run_id serves get_by_run_id, get_by_run_ids and the grouped
+        # get_stats_by_run_ids aggregate; (run_id, model_name) serves
+        # get_by_run_and_model, and trailing created_at returns its rows
+        # already in ORDER BY order, so neither query needs a sort step.
+        Index("ix_results_run_model_created", "benchmark_run_id", "model_name", "created_at"),
+    )
 
-    id: Mapped[str] = mapped_column(
-        String(36),
+    id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=uuid.uuid4,
     )
-    benchmark_run_id: Mapped[str] = mapped_column(
-        String(36),
+    benchmark_run_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
         ForeignKey("benchmark_runs.id", ondelete="CASCADE"),
         nullable=False,
     )
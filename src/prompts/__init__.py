@@ -1,16 +1,18 @@
 """Benchmark prompt suites for AI model fingerprinting."""
 
+from src.prompts.base import Prompt  # noqa: F401
 from src.prompts.capability import CAPABILITY_PROMPTS  # noqa: F401
 from src.prompts.fingerprint import FINGERPRINT_PROMPTS  # noqa: F401
 from src.prompts.identity import IDENTITY_PROMPTS  # noqa: F401
 
-PROMPT_SUITES: dict[str, list[dict[str, str]]] = {
+PROMPT_SUITES: dict[str, tuple[Prompt, ...]] = {
     "identity": IDENTITY_PROMPTS,
     "capability": CAPABILITY_PROMPTS,
     "fingerprint": FINGERPRINT_PROMPTS,
 }
 
 __all__ = [
+    "Prompt",
     "IDENTITY_PROMPTS",
     "CAPABILITY_PROMPTS",
     "FINGERPRINT_PROMPTS",
@@ -0,0 +1,19 @@
+"""Prompt record shared by all benchmark prompt suites."""
+
+import hashlib
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True, slots=True)
+class Prompt:
+    """A single benchmark prompt and the category its results are stored under."""
+
+    category: str
+    text: str
+    # Hex digest of ``text``, computed once when the suite is imported and used
+    # as the prompt's part of the runner's response-cache key.
+    digest: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        digest = hashlib.blake2b(self.text.encode(), digest_size=16).hexdigest()
+        object.__setattr__(self, "digest", digest)
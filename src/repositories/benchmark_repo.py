@@ -1,12 +1,15 @@
 """Repository for BenchmarkRun CRUD operations."""
 
+import uuid
 from datetime import datetime
+from typing import Any, cast
 
-from sqlalchemy import select
+from sqlalchemy import CursorResult, ScalarSelect, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.models.benchmark import BenchmarkRun
+from src.models.result import BenchmarkResult
 
 
 class BenchmarkRepository:
@@ -15,70 +18,103 @@ class BenchmarkRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
-    async def create(self, name: str, description: str, prompt_suite: str) -> BenchmarkRun:
+    async def create(
+        self,
+        name: str,
+        description: str,
+        prompt_suite: str,
+        status: str = "pending",
+    ) -> BenchmarkRun:
         """Create a new benchmark run.
 
         Args:
             name: Human-readable name for the run.
             description: Optional description.
             prompt_suite: Which prompt suite to use.
+            status: Initial status (pending, running, completed, failed).
 
         Returns:
             The created BenchmarkRun with generated ID.
         """
         run = BenchmarkRun(
+            id=uuid.uuid4(),
             name=name,
             description=description,
             prompt_suite=prompt_suite,
-            status="pending",
+            status=status,
         )
+        # The ID is assigned client-side, so no flush is needed here; the INSERT
+        # goes out with the next statement's autoflush or the commit.
         self._session.add(run)
-        await self._session.flush()
         return run
 
-    async def get_by_id(self, run_id: str) -> BenchmarkRun | None:
-        """Fetch a benchmark run by ID, including its results.
+    async def get_by_id(
+        self,
+        run_id: uuid.UUID,
+        *,
+        include_results: bool = False,
+    ) -> BenchmarkRun | None:
+        """Fetch a benchmark run by ID.
 
         Args:
             run_id: The UUID of the benchmark run.
+            include_results: Eager-load every result row as well. Leave this off
+                when only run metadata is needed.
 
         Returns:
             The BenchmarkRun or None if not found.
         """
-        stmt = (
-            select(BenchmarkRun)
-            .where(BenchmarkRun.id == run_id)
-            .options(selectinload(BenchmarkRun.results))
-        )
+        stmt = select(BenchmarkRun).where(BenchmarkRun.id == run_id)
+        if include_results:
+            stmt = stmt.options(selectinload(BenchmarkRun.results))
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def list_all(self, limit: int = 50, offset: int = 0) -> list[BenchmarkRun]:
-        """List benchmark runs ordered by creation date (newest first).
+    async def get_with_result_count(self, run_id: uuid.UUID) -> tuple[BenchmarkRun, int] | None:
+        """Fetch a benchmark run by ID together with its result count.
+
+        Args:
+            run_id: The UUID of the benchmark run.
+
+        Returns:
+            A (BenchmarkRun, result count) pair, or None if not found.
+        """
+        stmt = select(BenchmarkRun, _result_count_subquery()).where(BenchmarkRun.id == run_id)
+        row = (await self._session.execute(stmt)).one_or_none()
+        return None if row is None else (row[0], row[1])
+
+    async def list_with_result_counts(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[tuple[BenchmarkRun, int]]:
+        """List benchmark runs (newest first) with their result counts.
+
+        Counts come from a correlated subquery, so results are never loaded.
 
         Args:
             limit: Maximum number of runs to return.
             offset: Number of runs to skip.
 
         Returns:
-            List of BenchmarkRun objects.
+            List of (BenchmarkRun, result count) pairs.
         """
         stmt = (
-            select(BenchmarkRun)
+            select(BenchmarkRun, _result_count_subquery())
             .order_by(BenchmarkRun.created_at.desc())
             .limit(limit)
             .offset(offset)
         )
         result = await self._session.execute(stmt)
-        return list(result.scalars().all())
+        return [(run, count) for run, count in result.all()]
 
     async def update_status(
         self,
-        run_id: str,
+        run_id: uuid.UUID,
         status: str,
         completed_at: datetime | None = None,
-    ) -> BenchmarkRun | None:
-        """Update the status of a benchmark run.
+    ) -> bool:
+        """Update the status of a benchmark run with a single UPDATE statement.
 
         Args:
             run_id: The UUID of the benchmark run.
@@ -86,13 +122,22 @@ class BenchmarkRepository:
             completed_at: Timestamp when the run completed.
 
         Returns:
-            The updated BenchmarkRun or None if not found.
+            True if the run exists and was updated, False otherwise.
         """
-        run = await self.get_by_id(run_id)
-        if run is None:
-            return None
-        run.status = status
+        values: dict[str, object] = {"status": status}
         if completed_at:
-            run.completed_at = completed_at
-        await self._session.flush()
-        return run
+            values["completed_at"] = completed_at
+        stmt = update(BenchmarkRun).where(BenchmarkRun.id == run_id).values(**values)
+        # DML executes return a CursorResult, which is where rowcount lives
+        result = cast("CursorResult[Any]", await self._session.execute(stmt))
+        return bool(result.rowcount)
+
+
+def _result_count_subquery() -> ScalarSelect[int]:
+    """Correlated COUNT of a run's results, so result rows are never loaded."""
+    return (
+        select(func.count(BenchmarkResult.id))
+        .where(BenchmarkResult.benchmark_run_id == BenchmarkRun.id)
+        .correlate(BenchmarkRun)
+        .scalar_subquery()
+    )
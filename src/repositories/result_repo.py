@@ -1,10 +1,36 @@
 """Repository for BenchmarkResult CRUD operations."""
 
-from sqlalchemy import select
+import uuid
+
+from sqlalchemy import Float, Row, Select, bindparam, cast, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.result import BenchmarkResult
 
+# Run-level aggregates for comparisons, computed by the database so no response
+# text leaves it: (benchmark_run_id, result_count, avg_latency_ms,
+# avg_response_length, avg_total_tokens, error_count). Averages skip NULLs, like
+# the Python filters they replace; empty responses and empty error messages count
+# as absent.
+RunStats = Row[tuple[uuid.UUID, int, float | None, float | None, float | None, int]]
+
+# Built once at import: the construct is reused with bound run IDs, so each call
+# skips rebuilding the select and goes straight to SQLAlchemy's compiled cache.
+_RUN_STATS_STMT = (
+    select(
+        BenchmarkResult.benchmark_run_id,
+        func.count().label("result_count"),
+        cast(func.avg(BenchmarkResult.latency_ms), Float).label("avg_latency_ms"),
+        cast(func.avg(func.nullif(func.length(BenchmarkResult.response_text), 0)), Float).label(
+            "avg_response_length"
+        ),
+        cast(func.avg(BenchmarkResult.total_tokens), Float).label("avg_total_tokens"),
+        func.count(func.nullif(BenchmarkResult.error_message, "")).label("error_count"),
+    )
+    .where(BenchmarkResult.benchmark_run_id.in_(bindparam("run_ids", expanding=True)))
+    .group_by(BenchmarkResult.benchmark_run_id)
+)
+
 
 class ResultRepository:
     """Database access layer for benchmark results."""
@@ -14,7 +40,7 @@ class ResultRepository:
 
     async def create(
         self,
-        benchmark_run_id: str,
+        benchmark_run_id: uuid.UUID,
         model_name: str,
         provider: str,
         api_base_url: str,
@@ -47,6 +73,7 @@ class ResultRepository:
             The created BenchmarkResult.
         """
         result = BenchmarkResult(
+            id=uuid.uuid4(),
             benchmark_run_id=benchmark_run_id,
             model_name=model_name,
             provider=provider,
@@ -60,11 +87,32 @@ class ResultRepository:
             completion_tokens=completion_tokens,
             total_tokens=total_tokens,
         )
+        # No per-row flush: pending rows are batched into one INSERT by the
+        # next autoflush or commit, and the ID is assigned client-side above.
         self._session.add(result)
-        await self._session.flush()
         return result
 
-    async def get_by_run_id(self, benchmark_run_id: str) -> list[BenchmarkResult]:
+    async def create_many(self, rows: list[dict[str, object]]) -> int:
+        """Store many benchmark results in a single bulk INSERT.
+
+        Args:
+            rows: Column-name → value mappings, one per result. IDs and
+                timestamps are filled in by the column defaults.
+
+        Returns:
+            The number of rows inserted.
+        """
+        if not rows:
+            return 0
+        # Append-only rows: no ORM objects enter the identity map. Autoflush stays
+        # on so a parent run that is still pending is INSERTed first. IDs and
+        # timestamps are client-side defaults, so no RETURNING is needed and the
+        # batch goes out as one executemany call (insertmanyvalues batching on
+        # drivers that use it).
+        await self._session.execute(insert(BenchmarkResult), rows)
+        return len(rows)
+
+    async def get_by_run_id(self, benchmark_run_id: uuid.UUID) -> list[BenchmarkResult]:
         """Fetch all results for a specific benchmark run.
 
         Args:
@@ -73,17 +121,12 @@ class ResultRepository:
         Returns:
             List of BenchmarkResult objects.
         """
-        stmt = (
-            select(BenchmarkResult)
-            .where(BenchmarkResult.benchmark_run_id == benchmark_run_id)
-            .order_by(BenchmarkResult.created_at)
-        )
-        result = await self._session.execute(stmt)
+        result = await self._session.execute(_results_stmt(benchmark_run_id))
         return list(result.scalars().all())
 
     async def get_by_run_and_model(
         self,
-        benchmark_run_id: str,
+        benchmark_run_id: uuid.UUID,
         model_name: str,
     ) -> list[BenchmarkResult]:
         """Fetch results for a specific model within a benchmark run.
@@ -95,13 +138,59 @@ class ResultRepository:
         Returns:
             Filtered list of BenchmarkResult objects.
         """
+        result = await self._session.execute(_results_stmt(benchmark_run_id, model_name))
+        return list(result.scalars().all())
+
+    async def get_by_run_ids(self, benchmark_run_ids: list[uuid.UUID]) -> list[BenchmarkResult]:
+        """Fetch the results of several benchmark runs in a single query.
+
+        Args:
+            benchmark_run_ids: The parent run IDs.
+
+        Returns:
+            List of BenchmarkResult objects, in creation order within each run.
+        """
+        if not benchmark_run_ids:
+            return []
         stmt = (
             select(BenchmarkResult)
-            .where(
-                BenchmarkResult.benchmark_run_id == benchmark_run_id,
-                BenchmarkResult.model_name == model_name,
-            )
+            .where(BenchmarkResult.benchmark_run_id.in_(benchmark_run_ids))
             .order_by(BenchmarkResult.created_at)
         )
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
+
+    async def get_stats_by_run_ids(
+        self,
+        benchmark_run_ids: list[uuid.UUID],
+    ) -> dict[uuid.UUID, RunStats]:
+        """Aggregate the results of several runs in a single grouped query.
+
+        Args:
+            benchmark_run_ids: The parent run IDs.
+
+        Returns:
+            Mapping of run ID → row with ``result_count``, ``avg_latency_ms``,
+            ``avg_response_length``, ``avg_total_tokens`` and ``error_count``.
+            Runs without results are absent; averages are None when no result
+            has the value.
+        """
+        if not benchmark_run_ids:
+            return {}
+        result = await self._session.execute(_RUN_STATS_STMT, {"run_ids": benchmark_run_ids})
+        return {row.benchmark_run_id: row for row in result}
+
+
+def _results_stmt(
+    benchmark_run_id: uuid.UUID,
+    model_name: str | None = None,
+) -> Select[BenchmarkResult]:
+    """Build the results query for a run, optionally narrowed to one model.
+
+    Both shapes resolve through ix_results_run_model_created, which also
+    supplies the created_at ordering.
+    """
+    stmt = select(BenchmarkResult).where(BenchmarkResult.benchmark_run_id == benchmark_run_id)
+    if model_name is not None:
+        stmt = stmt.where(BenchmarkResult.model_name == model_name)
+    return stmt.order_by(BenchmarkResult.created_at)
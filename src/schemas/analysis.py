@@ -1,5 +1,6 @@
 """Pydantic schemas for deep analysis requests and reports."""
 
+import uuid
 from datetime import datetime
 
 from pydantic import BaseModel, Field
@@ -30,6 +31,8 @@ class DeepAnalysisRequest(BaseModel):
 class RedFlag(BaseModel):
     """A single red flag detected during analysis."""
 
+    model_config = {"frozen": True}
+
     severity: str = Field(
         ...,
         description="HIGH, MEDIUM, or LOW",
@@ -45,20 +48,26 @@ class RedFlag(BaseModel):
 class ModelReport(BaseModel):
     """Analysis report for a single model."""
 
+    model_config = {"frozen": True}
+
     model_name: str
     provider: str
-    benchmark_run_ids: dict[str, str] = Field(
+    benchmark_run_ids: dict[str, uuid.UUID] = Field(
         default_factory=dict,
         description="Mapping of suite name → benchmark run ID",
     )
     identity_claims: list[str] = Field(
         default_factory=list,
-        description="What the model claims to be from identity probes",
+        description="What the model claims to be from identity probes, most frequent first",
     )
     knowledge_cutoffs: list[str] = Field(
         default_factory=list,
         description="Knowledge cutoff dates mentioned",
     )
+    knowledge_cutoffs_unique: tuple[str, ...] = Field(
+        default=(),
+        description="Distinct knowledge cutoff dates mentioned, sorted",
+    )
     avg_latency_ms: float = 0.0
     total_probes: int = 0
     errors: int = 0
@@ -69,6 +78,8 @@ class ModelReport(BaseModel):
 class CrossModelComparison(BaseModel):
     """Comparison between two models to check if they're the same."""
 
+    model_config = {"frozen": True}
+
     model_a: str
     model_b: str
     similarity_score: float = Field(
@@ -1,5 +1,6 @@
 """Pydantic schemas for benchmark runs."""
 
+import uuid
 from datetime import datetime
 from enum import StrEnum
 
@@ -37,12 +38,19 @@ class BenchmarkRunCreate(BaseModel):
         min_length=1,
         description="List of model endpoints to benchmark",
     )
+    reuse_cached_responses: bool = Field(
+        default=False,
+        description=(
+            "Serve prompts this process already answered successfully for the same "
+            "endpoint and model from cache (stored latency is the original call's)"
+        ),
+    )
 
 
 class BenchmarkRunResponse(BaseModel):
     """Response schema for a benchmark run."""
 
-    id: str
+    id: uuid.UUID
     name: str
     description: str
     status: BenchmarkRunStatus
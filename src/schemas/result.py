@@ -1,6 +1,8 @@
 """Pydantic schemas for benchmark results and model configuration."""
 
+import uuid
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
@@ -9,16 +11,14 @@ class ModelConfig(BaseModel):
     """Configuration for a single model endpoint to benchmark."""
 
     model_name: str = Field(..., min_length=1, max_length=100, description="Model identifier")
-    provider: str = Field(
+    provider: Literal["openai", "anthropic", "suspect", "generic"] = Field(
         ...,
-        pattern=r"^(openai|anthropic|suspect|generic)$",
         description="Provider type",
     )
     api_key: str = Field(default="", description="API key (loaded from env if empty)")
     api_base_url: str = Field(default="", description="Base URL for the API")
-    protocol: str = Field(
+    protocol: Literal["openai", "anthropic", ""] = Field(
         default="",
-        pattern=r"^(openai|anthropic|)$",
         description="API protocol to use (openai or anthropic). Auto-detected from provider if empty.",
     )
 
@@ -26,8 +26,8 @@ class ModelConfig(BaseModel):
 class BenchmarkResultResponse(BaseModel):
     """Response schema for a single benchmark result."""
 
-    id: str
-    benchmark_run_id: str
+    id: uuid.UUID
+    benchmark_run_id: uuid.UUID
     model_name: str
     provider: str
     api_base_url: str
@@ -47,8 +47,8 @@ class BenchmarkResultResponse(BaseModel):
 class ComparisonRequest(BaseModel):
     """Request schema to compare two benchmark runs."""
 
-    baseline_run_id: str = Field(..., description="ID of the trusted baseline run")
-    suspect_run_id: str = Field(..., description="ID of the suspect run to compare")
+    baseline_run_id: uuid.UUID = Field(..., description="ID of the trusted baseline run")
+    suspect_run_id: uuid.UUID = Field(..., description="ID of the suspect run to compare")
 
 
 class ComparisonScore(BaseModel):
@@ -1,21 +1,38 @@
 """Benchmark runner service — orchestrates running prompt suites against model adapters."""
 
 import asyncio
+import hashlib
 import logging
+import uuid
+from dataclasses import replace
 from datetime import UTC, datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.adapters.base import CompletionResponse, ModelAdapter
 from src.adapters.factory import create_adapter
-from src.prompts import PROMPT_SUITES
+from src.models.benchmark import BenchmarkRun
+from src.prompts import PROMPT_SUITES, Prompt
 from src.repositories.benchmark_repo import BenchmarkRepository
 from src.repositories.result_repo import ResultRepository
-from src.schemas.benchmark import BenchmarkRunCreate, BenchmarkRunResponse
+from src.schemas.benchmark import (
+    BenchmarkRunCreate,
+    BenchmarkRunResponse,
+    BenchmarkRunStatus,
+    PromptSuite,
+)
 from src.schemas.result import ModelConfig
 
 logger = logging.getLogger(__name__)
 
+# Successful responses keyed by (base URL, model, API key digest, system prompt,
+# prompt digest), shared across runs so that a re-run with reuse_cached_responses
+# skips prompts already answered by the same account and configuration.
+# Insertion-ordered, so the oldest entry is evicted once the cap is reached.
+_ResponseCacheKey = tuple[str, str, str, str, str]
+_RESPONSE_CACHE: dict[_ResponseCacheKey, CompletionResponse] = {}
+_RESPONSE_CACHE_MAX = 4096
+
 
 class BenchmarkRunnerService:
     """Orchestrates benchmark runs: loads prompts, calls adapters, stores results."""
@@ -39,16 +56,18 @@ class BenchmarkRunnerService:
             name=request.name,
             description=request.description,
             prompt_suite=request.prompt_suite.value,
+            status="running",
         )
-        await self._bench_repo.update_status(run.id, "running")
 
-        prompts = PROMPT_SUITES.get(request.prompt_suite.value, [])
+        prompts = PROMPT_SUITES.get(request.prompt_suite.value, ())
         if not prompts:
             await self._bench_repo.update_status(run.id, "failed")
-            return self._build_response(run, result_count=0)
+            return build_run_response(run, result_count=0)
 
         try:
-            result_count = await self._execute_all(run.id, request.model_configs, prompts)
+            result_count = await self._execute_all(
+                run.id, request.model_configs, prompts, request.reuse_cached_responses
+            )
             await self._bench_repo.update_status(run.id, "completed", datetime.now(UTC))
         except Exception:
             logger.exception("Benchmark run %s failed", run.id)
@@ -56,128 +75,199 @@ class BenchmarkRunnerService:
             result_count = 0
 
         updated_run = await self._bench_repo.get_by_id(run.id)
-        return self._build_response(updated_run or run, result_count)
+        return build_run_response(updated_run or run, result_count)
 
     async def _execute_all(
         self,
-        run_id: str,
+        run_id: uuid.UUID,
         model_configs: list[ModelConfig],
-        prompts: list[dict[str, str]],
+        prompts: tuple[Prompt, ...],
+        reuse_cached: bool = False,
     ) -> int:
-        """Execute all prompts against all models with concurrency limiting.
+        """Execute all prompts against all models, persisting each model as it finishes.
 
         Args:
             run_id: The parent benchmark run ID.
             model_configs: List of model configurations.
-            prompts: List of prompt dictionaries.
+            prompts: The prompt suite to send to every model.
+            reuse_cached: Serve previously answered prompts from the response cache.
 
         Returns:
             Total number of results stored.
         """
-        semaphore = asyncio.Semaphore(self._max_concurrent)
-        tasks: list[asyncio.Task[None]] = []
-
-        for config in model_configs:
-            adapter = create_adapter(config)
-            for prompt in prompts:
-                task = asyncio.create_task(
-                    self._execute_single(semaphore, run_id, adapter, config, prompt)
-                )
-                tasks.append(task)
+        # Every model's batch runs at once and each request takes a slot from one
+        # shared semaphore, so up to max_concurrent calls stay in flight in total
+        # and slots freed by a fast model go straight to the ones still running.
+        request_slots = asyncio.Semaphore(self._max_concurrent)
+        writes: asyncio.Queue[list[dict[str, object]] | None] = asyncio.Queue()
 
-        await asyncio.gather(*tasks, return_exceptions=True)
-        return len(tasks)
+        async with asyncio.TaskGroup() as group:
+            writer = group.create_task(self._write_results(writes))
+            async with asyncio.TaskGroup() as models:
+                for config in model_configs:
+                    models.create_task(
+                        self._run_model(
+                            run_id, config, prompts, request_slots, reuse_cached, writes
+                        )
+                    )
+            writes.put_nowait(None)
+        return writer.result()
 
-    async def _execute_single(
+    async def _run_model(
         self,
-        semaphore: asyncio.Semaphore,
-        run_id: str,
-        adapter: ModelAdapter,
+        run_id: uuid.UUID,
         config: ModelConfig,
-        prompt: dict[str, str],
+        prompts: tuple[Prompt, ...],
+        request_slots: asyncio.Semaphore,
+        reuse_cached: bool,
+        writes: asyncio.Queue[list[dict[str, object]] | None],
     ) -> None:
-        """Execute a single prompt against a single model.
+        """Send one model's prompts as a batch and queue its rows for the writer.
 
         Args:
-            semaphore: Concurrency limiter.
             run_id: The parent benchmark run ID.
-            adapter: The model adapter to use.
             config: Model configuration.
-            prompt: Prompt dictionary with 'category' and 'text'.
+            prompts: The prompt suite sent to every model.
+            request_slots: Run-wide semaphore bounding in-flight requests.
+            reuse_cached: Serve previously answered prompts from the response cache.
+            writes: Queue feeding the result writer.
         """
-        async with semaphore:
-            response = await self._safe_complete(adapter, prompt["text"])
-            await self._store_result(run_id, config, prompt, response)
+        async with create_adapter(config) as adapter:
+            if reuse_cached:
+                responses = await _cached_batch_complete(
+                    adapter, prompts, self._max_concurrent, request_slots
+                )
+            else:
+                responses = await adapter.batch_complete(
+                    [prompt.text for prompt in prompts],
+                    self._max_concurrent,
+                    request_slots=request_slots,
+                )
+        writes.put_nowait(
+            [
+                self._build_result_row(run_id, config, prompt, response)
+                for prompt, response in zip(prompts, responses, strict=True)
+            ]
+        )
 
-    async def _safe_complete(
+    async def _write_results(
         self,
-        adapter: ModelAdapter,
-        prompt_text: str,
-    ) -> CompletionResponse:
-        """Call adapter.complete with error handling.
+        writes: asyncio.Queue[list[dict[str, object]] | None],
+    ) -> int:
+        """Persist queued result batches until the ``None`` sentinel arrives.
+
+        This is the only coroutine touching the session while calls are in
+        flight, so writes overlap API latency without concurrent session use.
 
         Args:
-            adapter: The model adapter.
-            prompt_text: The prompt to send.
+            writes: Queue of row batches, terminated by ``None``.
 
         Returns:
-            A CompletionResponse (may contain an error).
+            Total number of results stored.
         """
-        try:
-            return await adapter.complete(prompt_text)
-        except Exception as exc:
-            logger.warning("Adapter error for %s: %s", adapter.model_name, exc)
-            return CompletionResponse(text="", error=str(exc))
+        stored = 0
+        while (rows := await writes.get()) is not None:
+            stored += await self._result_repo.create_many(rows)
+        return stored
 
-    async def _store_result(
+    def _build_result_row(
         self,
-        run_id: str,
+        run_id: uuid.UUID,
         config: ModelConfig,
-        prompt: dict[str, str],
+        prompt: Prompt,
         response: CompletionResponse,
-    ) -> None:
-        """Persist a single result to the database.
+    ) -> dict[str, object]:
+        """Build the column mapping for a single result row.
 
         Args:
             run_id: The parent benchmark run ID.
             config: Model configuration.
             prompt: The prompt that was sent.
             response: The response received.
+
+        Returns:
+            A BenchmarkResult column → value mapping for bulk insert.
         """
-        await self._result_repo.create(
-            benchmark_run_id=run_id,
-            model_name=config.model_name,
-            provider=config.provider,
-            api_base_url=config.api_base_url,
-            prompt_category=prompt["category"],
-            prompt_text=prompt["text"],
-            response_text=response.text,
-            error_message=response.error,
-            latency_ms=response.latency_ms,
-            prompt_tokens=response.prompt_tokens,
-            completion_tokens=response.completion_tokens,
-            total_tokens=response.total_tokens,
-        )
+        return {
+            "benchmark_run_id": run_id,
+            "model_name": config.model_name,
+            "provider": config.provider,
+            "api_base_url": config.api_base_url,
+            "prompt_category": prompt.category,
+            "prompt_text": prompt.text,
+            "response_text": response.text,
+            "error_message": response.error,
+            "latency_ms": response.latency_ms,
+            "prompt_tokens": response.prompt_tokens,
+            "completion_tokens": response.completion_tokens,
+            "total_tokens": response.total_tokens,
+        }
 
-    def _build_response(self, run: object, result_count: int) -> BenchmarkRunResponse:
-        """Build a BenchmarkRunResponse from a BenchmarkRun ORM object.
 
-        Args:
-            run: The BenchmarkRun ORM instance.
-            result_count: Number of results collected.
+def build_run_response(run: BenchmarkRun, result_count: int) -> BenchmarkRunResponse:
+    """Build a response from a trusted ORM row, skipping Pydantic validation.
 
-        Returns:
-            A Pydantic response schema.
-        """
-        return BenchmarkRunResponse.model_validate(
-            {
-                "id": getattr(run, "id"),
-                "name": getattr(run, "name"),
-                "description": getattr(run, "description"),
-                "status": getattr(run, "status"),
-                "prompt_suite": getattr(run, "prompt_suite"),
-                "created_at": getattr(run, "created_at"),
-                "completed_at": getattr(run, "completed_at"),
-                "result_count": result_count,
-            }
+    Args:
+        run: The BenchmarkRun ORM instance.
+        result_count: Number of results collected.
+
+    Returns:
+        A Pydantic response schema.
+    """
+    return BenchmarkRunResponse.model_construct(
+        id=run.id,
+        name=run.name,
+        description=run.description,
+        status=BenchmarkRunStatus(run.status),
+        prompt_suite=PromptSuite(run.prompt_suite),
+        created_at=run.created_at,
+        completed_at=run.completed_at,
+        result_count=result_count,
+    )
+
+
+async def _cached_batch_complete(
+    adapter: ModelAdapter,
+    prompts: tuple[Prompt, ...],
+    max_in_flight: int,
+    request_slots: asyncio.Semaphore | None = None,
+    system_prompt: str = "",
+) -> list[CompletionResponse]:
+    """Batch-complete only the prompts missing from the response cache.
+
+    Successful fresh responses are cached; errors are not, so a re-run retries them.
+    Cached entries are stored without ``latency_ms``: a replayed answer was not
+    timed in this run, so its row must not carry the original call's latency.
+
+    Args:
+        adapter: The model adapter to call on cache misses.
+        prompts: The prompts to answer, in order.
+        max_in_flight: Concurrent request budget for the misses.
+        request_slots: Optional semaphore shared with other batches, held per request.
+        system_prompt: Optional system instruction applied to every prompt.
+
+    Returns:
+        One CompletionResponse per prompt, in the same order.
+    """
+    # Digest rather than the raw key, so the cache never holds credentials
+    key_digest = hashlib.blake2b(adapter.api_key.encode(), digest_size=16).hexdigest()
+    keys = [
+        (adapter.api_base_url, adapter.model_name, key_digest, system_prompt, prompt.digest)
+        for prompt in prompts
+    ]
+    cached = [_RESPONSE_CACHE.get(key) for key in keys]
+    missing = [index for index, response in enumerate(cached) if response is None]
+    fresh: dict[int, CompletionResponse] = {}
+    if missing:
+        answers = await adapter.batch_complete(
+            [prompts[i].text for i in missing], max_in_flight, system_prompt, request_slots
         )
+        fresh = dict(zip(missing, answers, strict=True))
+        for index, response in fresh.items():
+            if not response.is_error:
+                if len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAX:
+                    del _RESPONSE_CACHE[next(iter(_RESPONSE_CACHE))]
+                _RESPONSE_CACHE[keys[index]] = replace(response, latency_ms=None)
+    return [
+        response if response is not None else fresh[index] for index, response in enumerate(cached)
+    ]
@@ -1,12 +1,17 @@
 """Deep analysis service — runs all suites & produces a structured fraud report."""
 
+import asyncio
 import logging
 import re
+import uuid
+from collections import Counter
 from datetime import UTC, datetime
+from functools import lru_cache
 from itertools import combinations
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from src.models.result import BenchmarkResult
 from src.prompts import PROMPT_SUITES
 from src.repositories.result_repo import ResultRepository
 from src.schemas.analysis import (
@@ -40,15 +45,36 @@ _PROXY_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+_SEVERITY_RANK = {"HIGH": 0, "MEDIUM": 1, "LOW": 2}
+
+_NAME_SEPARATORS = str.maketrans("-_", "  ")
+
+# (section, key) fingerprint metrics compared by _vector_similarity
+_SIMILARITY_FEATURES = (
+    ("style", "avg_word_count"),
+    ("style", "uses_markdown"),
+    ("style", "uses_bullet_lists"),
+    ("vocabulary", "unique_ratio"),
+    ("vocabulary", "hedging_ratio"),
+    ("vocabulary", "confidence_ratio"),
+    ("structure", "avg_paragraph_count"),
+    ("structure", "starts_with_greeting_ratio"),
+)
+
 
 class DeepAnalysisService:
     """Orchestrates full deep analysis: run suites, fingerprint, detect fraud."""
 
-    def __init__(self, session: AsyncSession, max_concurrent: int = 5) -> None:
-        self._session = session
-        self._runner = BenchmarkRunnerService(session, max_concurrent)
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        max_concurrent: int = 5,
+    ) -> None:
+        # Suite runs overlap, and a session cannot be shared between concurrent
+        # tasks, so each run opens (and commits) its own session.
+        self._session_factory = session_factory
+        self._max_concurrent = max_concurrent
         self._fingerprinter = FingerprintService()
-        self._result_repo = ResultRepository(session)
 
     async def analyze(self, request: DeepAnalysisRequest) -> DeepAnalysisReport:
         """Run full deep analysis for all models across all requested suites.
@@ -60,13 +86,28 @@ class DeepAnalysisService:
             A complete DeepAnalysisReport with red flags and verdict.
         """
         started_at = datetime.now(UTC)
-        model_reports: list[ModelReport] = []
 
-        for config in request.model_configs:
-            report = await self._analyze_single_model(
-                config, request.suites, request.name
+        # Every (model, suite) run overlaps, at most max_concurrent at a time, and
+        # the request budget is split between them the same way the runner splits
+        # it between models.
+        suites = [suite for suite in request.suites if suite in PROMPT_SUITES]
+        run_count = min(self._max_concurrent, max(len(request.model_configs) * len(suites), 1))
+        run_slots = asyncio.Semaphore(self._max_concurrent)
+        in_flight_per_run = max(1, self._max_concurrent // run_count)
+
+        suite_run_ids = await asyncio.gather(
+            *(
+                self._run_model_suites(config, suites, request.name, run_slots, in_flight_per_run)
+                for config in request.model_configs
             )
-            model_reports.append(report)
+        )
+        results_by_run = await self._load_results(
+            [run_id for run_ids in suite_run_ids for run_id in run_ids.values()]
+        )
+        model_reports = [
+            self._build_model_report(config, run_ids, results_by_run)
+            for config, run_ids in zip(request.model_configs, suite_run_ids, strict=True)
+        ]
 
         cross_comparisons = self._cross_compare(model_reports)
         red_flags = self._detect_red_flags(model_reports, cross_comparisons)
@@ -84,39 +125,68 @@ class DeepAnalysisService:
             summary=summary,
         )
 
-    async def _analyze_single_model(
+    async def _run_model_suites(
         self,
         config: ModelConfig,
         suites: list[str],
         analysis_name: str,
-    ) -> ModelReport:
-        """Run all requested suites for a single model and build its report.
+        run_slots: asyncio.Semaphore,
+        in_flight_per_run: int,
+    ) -> dict[str, uuid.UUID]:
+        """Run all requested suites for a single model.
 
         Args:
             config: The model configuration.
-            suites: List of suite names to run.
+            suites: List of known suite names to run.
             analysis_name: Parent analysis name for labeling benchmark runs.
+            run_slots: Semaphore bounding how many suite runs overlap.
+            in_flight_per_run: Concurrent request budget for each suite run.
 
         Returns:
-            A ModelReport with fingerprint and identity claims.
+            Mapping of suite name → benchmark run ID, in suite order.
         """
-        run_ids: dict[str, str] = {}
-        all_results: list = []
-
-        for suite_name in suites:
-            if suite_name not in PROMPT_SUITES:
-                continue
-            run_response = await self._runner.run_benchmark(
-                BenchmarkRunCreate(
-                    name=f"{analysis_name} — {config.model_name} — {suite_name}",
-                    description=f"Deep analysis: {suite_name} suite",
-                    prompt_suite=PromptSuite(suite_name),
-                    model_configs=[config],
-                )
+        run_ids = await asyncio.gather(
+            *(
+                self._run_suite(config, suite_name, analysis_name, run_slots, in_flight_per_run)
+                for suite_name in suites
             )
-            run_ids[suite_name] = run_response.id
-            results = await self._result_repo.get_by_run_id(run_response.id)
-            all_results.extend(results)
+        )
+        return dict(zip(suites, run_ids, strict=True))
+
+    async def _load_results(
+        self, run_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, list[BenchmarkResult]]:
+        """Fetch the results of every analysis run in one query, grouped by run.
+
+        Args:
+            run_ids: The benchmark runs to load.
+
+        Returns:
+            Mapping of run ID → its results in creation order.
+        """
+        results_by_run: dict[uuid.UUID, list[BenchmarkResult]] = {run_id: [] for run_id in run_ids}
+        async with self._session_factory() as session:
+            for result in await ResultRepository(session).get_by_run_ids(run_ids):
+                results_by_run[result.benchmark_run_id].append(result)
+        return results_by_run
+
+    def _build_model_report(
+        self,
+        config: ModelConfig,
+        run_ids: dict[str, uuid.UUID],
+        results_by_run: dict[uuid.UUID, list[BenchmarkResult]],
+    ) -> ModelReport:
+        """Build one model's report from its suite runs' results.
+
+        Args:
+            config: The model configuration.
+            run_ids: Mapping of suite name → benchmark run ID.
+            results_by_run: Results of every analysis run, grouped by run ID.
+
+        Returns:
+            A ModelReport with fingerprint and identity claims.
+        """
+        all_results = [result for run_id in run_ids.values() for result in results_by_run[run_id]]
 
         fingerprint = self._fingerprinter.generate_fingerprint(all_results)
         identity_claims = _extract_identity_claims(all_results)
@@ -132,6 +202,7 @@ class DeepAnalysisService:
             benchmark_run_ids=run_ids,
             identity_claims=identity_claims,
             knowledge_cutoffs=cutoffs,
+            knowledge_cutoffs_unique=tuple(sorted(set(cutoffs))),
             avg_latency_ms=round(avg_latency, 2),
             total_probes=len(all_results),
             errors=errors,
@@ -139,6 +210,39 @@ class DeepAnalysisService:
             fingerprint=fingerprint,
         )
 
+    async def _run_suite(
+        self,
+        config: ModelConfig,
+        suite_name: str,
+        analysis_name: str,
+        run_slots: asyncio.Semaphore,
+        in_flight_per_run: int,
+    ) -> uuid.UUID:
+        """Run one suite against one model in its own session.
+
+        Args:
+            config: The model configuration.
+            suite_name: The suite to run.
+            analysis_name: Parent analysis name for labeling the benchmark run.
+            run_slots: Semaphore bounding how many suite runs overlap.
+            in_flight_per_run: Concurrent request budget for this run.
+
+        Returns:
+            The benchmark run ID.
+        """
+        async with run_slots, self._session_factory() as session:
+            runner = BenchmarkRunnerService(session, in_flight_per_run)
+            run_response = await runner.run_benchmark(
+                BenchmarkRunCreate(
+                    name=f"{analysis_name} — {config.model_name} — {suite_name}",
+                    description=f"Deep analysis: {suite_name} suite",
+                    prompt_suite=PromptSuite(suite_name),
+                    model_configs=[config],
+                )
+            )
+            await session.commit()
+        return run_response.id
+
     def _cross_compare(
         self, reports: list[ModelReport]
     ) -> list[CrossModelComparison]:
@@ -150,10 +254,15 @@ class DeepAnalysisService:
         Returns:
             List of pairwise CrossModelComparison objects.
         """
+        # Pull each report's features and claim set out once, not once per pair
+        profiles = [
+            (report, _feature_vector(report.fingerprint), frozenset(report.identity_claims))
+            for report in reports
+        ]
         comparisons: list[CrossModelComparison] = []
-        for report_a, report_b in combinations(reports, 2):
-            score = _fingerprint_similarity(report_a.fingerprint, report_b.fingerprint)
-            shared = _find_shared_phrases(report_a, report_b)
+        for (report_a, vec_a, claims_a), (report_b, vec_b, claims_b) in combinations(profiles, 2):
+            score = _vector_similarity(vec_a, vec_b)
+            shared = _find_shared_phrases(claims_a, claims_b)
             verdict = _similarity_verdict(score)
             comparisons.append(
                 CrossModelComparison(
@@ -187,15 +296,19 @@ class DeepAnalysisService:
             flags.extend(self._check_consistency_flags(report))
         for comp in comparisons:
             flags.extend(self._check_similarity_flags(comp))
-        return sorted(flags, key=lambda f: {"HIGH": 0, "MEDIUM": 1, "LOW": 2}.get(f.severity, 3))
+
+        # Stable bucket split by severity (unknown severities last), same order as a sort
+        buckets: tuple[list[RedFlag], ...] = ([], [], [], [])
+        for flag in flags:
+            buckets[_SEVERITY_RANK.get(flag.severity, 3)].append(flag)
+        return [flag for bucket in buckets for flag in bucket]
 
     def _check_identity_flags(self, report: ModelReport) -> list[RedFlag]:
         """Check for identity-related red flags."""
         flags: list[RedFlag] = []
-        claims = [c.lower() for c in report.identity_claims]
-
-        requested_name = report.model_name.lower()
-        mismatches = [c for c in claims if not _names_match(requested_name, c)]
+        # Claims are already lowercased by _extract_identity_claims
+        requested_parts = _name_parts(report.model_name.lower())
+        mismatches = [c for c in report.identity_claims if not _names_match(requested_parts, c)]
         if mismatches:
             flags.append(
                 RedFlag(
@@ -224,14 +337,14 @@ class DeepAnalysisService:
     def _check_consistency_flags(self, report: ModelReport) -> list[RedFlag]:
         """Check for inconsistent knowledge cutoffs or proxy mentions."""
         flags: list[RedFlag] = []
-        unique_cutoffs = set(report.knowledge_cutoffs)
+        unique_cutoffs = report.knowledge_cutoffs_unique
         if len(unique_cutoffs) > 1:
             flags.append(
                 RedFlag(
                     severity="HIGH",
                     category="consistency",
                     description="Inconsistent knowledge cutoff dates across responses",
-                    evidence=f"Claimed cutoffs: {', '.join(sorted(unique_cutoffs))}",
+                    evidence=f"Claimed cutoffs: {', '.join(unique_cutoffs)}",
                 )
             )
         return flags
@@ -288,23 +401,28 @@ class DeepAnalysisService:
         Returns:
             Formatted summary string.
         """
-        lines = [f"Deep Analysis — Verdict: {verdict}", ""]
-        lines.append(f"Models analyzed: {len(reports)}")
-        lines.append(f"Red flags detected: {len(flags)}")
-        lines.append("")
+        lines = [
+            f"Deep Analysis — Verdict: {verdict}",
+            "",
+            f"Models analyzed: {len(reports)}",
+            f"Red flags detected: {len(flags)}",
+            "",
+        ]
         for report in reports:
-            lines.append(f"• {report.model_name} ({report.provider})")
-            lines.append(f"  Probes: {report.total_probes}, Errors: {report.errors}")
-            lines.append(f"  Avg latency: {report.avg_latency_ms:.0f}ms")
-            if report.identity_claims:
-                lines.append(f"  Identity claims: {', '.join(report.identity_claims[:3])}")
-            if report.knowledge_cutoffs:
-                lines.append(f"  Knowledge cutoffs: {', '.join(set(report.knowledge_cutoffs))}")
+            # One pre-joined block per report; the optional lines are appended to it
+            block = (
+                f"• {report.model_name} ({report.provider})\n"
+                f"  Probes: {report.total_probes}, Errors: {report.errors}\n"
+                f"  Avg latency: {report.avg_latency_ms:.0f}ms"
+            )
+            if claims := report.identity_claims:
+                block += f"\n  Identity claims: {', '.join(claims[:3])}"
+            if cutoffs := report.knowledge_cutoffs_unique:
+                block += f"\n  Knowledge cutoffs: {', '.join(cutoffs)}"
+            lines.append(block)
         if flags:
-            lines.append("")
-            lines.append("Red Flags:")
-            for flag in flags:
-                lines.append(f"  [{flag.severity}] {flag.category}: {flag.description}")
+            lines += ["", "Red Flags:"]
+            lines += [f"  [{flag.severity}] {flag.category}: {flag.description}" for flag in flags]
         return "\n".join(lines)
 
 
@@ -320,15 +438,15 @@ def _extract_identity_claims(results: list) -> list[str]:
         results: Benchmark results (identity-related responses).
 
     Returns:
-        Deduplicated list of claimed model names.
+        Deduplicated claimed model names, most frequently claimed first (ties
+        in first-seen order).
     """
-    claims: set[str] = set()
+    claims: Counter[str] = Counter()
     for r in results:
         if not r.response_text or r.prompt_category != "identity":
             continue
-        matches = _MODEL_NAME_PATTERN.findall(r.response_text)
-        claims.update(m.strip().lower() for m in matches)
-    return sorted(claims)
+        claims.update(_claims_in(r.response_text))
+    return [claim for claim, _ in claims.most_common()]
 
 
 def _extract_knowledge_cutoffs(results: list) -> list[str]:
@@ -344,60 +462,64 @@ def _extract_knowledge_cutoffs(results: list) -> list[str]:
     for r in results:
         if not r.response_text:
             continue
-        matches = _CUTOFF_PATTERN.findall(r.response_text)
-        cutoffs.extend(m.strip() for m in matches)
+        cutoffs.extend(_cutoffs_in(r.response_text))
     return cutoffs
 
 
-def _fingerprint_similarity(fp_a: dict, fp_b: dict) -> float:
-    """Compute similarity between two fingerprint dicts.
+# Deterministic models repeat answers verbatim across runs and re-analyses, so the
+# regex work is memoized per response text (bounded; texts are a few KB at most).
+@lru_cache(maxsize=1024)
+def _claims_in(text: str) -> tuple[str, ...]:
+    """Model names claimed in one response, stripped and lowercased."""
+    return tuple(m.strip().lower() for m in _MODEL_NAME_PATTERN.findall(text))
+
+
+@lru_cache(maxsize=1024)
+def _cutoffs_in(text: str) -> tuple[str, ...]:
+    """Knowledge cutoff dates mentioned in one response."""
+    return tuple(m.strip() for m in _CUTOFF_PATTERN.findall(text))
+
 
-    Compares style, vocabulary, and structure dimensions.
+def _feature_vector(fp: dict) -> tuple[float | None, ...] | None:
+    """Extract the numeric features compared between fingerprints.
 
     Args:
-        fp_a: First fingerprint dict.
-        fp_b: Second fingerprint dict.
+        fp: The fingerprint dictionary.
 
     Returns:
-        Similarity score 0.0-1.0.
+        One value (or None if missing) per ``_SIMILARITY_FEATURES`` entry, or
+        None if the fingerprint itself is an error.
     """
-    if "error" in fp_a or "error" in fp_b:
-        return 0.5
+    if "error" in fp:
+        return None
+    return tuple(_safe_get(fp, section, key) for section, key in _SIMILARITY_FEATURES)
 
-    candidates: list[float | None] = [
-        _compare_numeric(fp_a, fp_b, "style", "avg_word_count"),
-        _compare_numeric(fp_a, fp_b, "style", "uses_markdown"),
-        _compare_numeric(fp_a, fp_b, "style", "uses_bullet_lists"),
-        _compare_numeric(fp_a, fp_b, "vocabulary", "unique_ratio"),
-        _compare_numeric(fp_a, fp_b, "vocabulary", "hedging_ratio"),
-        _compare_numeric(fp_a, fp_b, "vocabulary", "confidence_ratio"),
-        _compare_numeric(fp_a, fp_b, "structure", "avg_paragraph_count"),
-        _compare_numeric(fp_a, fp_b, "structure", "starts_with_greeting_ratio"),
-    ]
-    valid = [s for s in candidates if s is not None]
-    return sum(valid) / max(len(valid), 1)
 
+def _vector_similarity(
+    vec_a: tuple[float | None, ...] | None,
+    vec_b: tuple[float | None, ...] | None,
+) -> float:
+    """Compute similarity between two fingerprint feature vectors.
 
-def _compare_numeric(
-    fp_a: dict, fp_b: dict, section: str, key: str
-) -> float | None:
-    """Compare a single numeric metric between two fingerprints.
+    Compares style, vocabulary, and structure dimensions; a feature missing
+    from either side is skipped.
 
     Args:
-        fp_a: First fingerprint.
-        fp_b: Second fingerprint.
-        section: Fingerprint section (style, vocabulary, structure).
-        key: Metric key within the section.
+        vec_a: First feature vector.
+        vec_b: Second feature vector.
 
     Returns:
-        Similarity 0.0-1.0, or None if data missing.
+        Similarity score 0.0-1.0 (0.5 if either fingerprint is an error).
     """
-    val_a = _safe_get(fp_a, section, key)
-    val_b = _safe_get(fp_b, section, key)
-    if val_a is None or val_b is None:
-        return None
-    max_val = max(abs(val_a), abs(val_b), 0.001)
-    return 1.0 - abs(val_a - val_b) / max_val
+    if vec_a is None or vec_b is None:
+        return 0.5
+
+    valid = [
+        1.0 - abs(val_a - val_b) / max(abs(val_a), abs(val_b), 0.001)
+        for val_a, val_b in zip(vec_a, vec_b, strict=True)
+        if val_a is not None and val_b is not None
+    ]
+    return sum(valid) / max(len(valid), 1)
 
 
 def _safe_get(fp: dict, section: str, key: str) -> float | None:
@@ -420,18 +542,16 @@ def _safe_get(fp: dict, section: str, key: str) -> float | None:
     return None
 
 
-def _find_shared_phrases(a: ModelReport, b: ModelReport) -> list[str]:
-    """Find notable shared phrases between two model reports.
+def _find_shared_phrases(claims_a: frozenset[str], claims_b: frozenset[str]) -> list[str]:
+    """Find notable shared phrases between two models' identity claims.
 
     Args:
-        a: First model report.
-        b: Second model report.
+        claims_a: First model's identity claims.
+        claims_b: Second model's identity claims.
 
     Returns:
-        List of shared phrases found in both models' identity claims.
+        Sorted list of phrases claimed by both models.
     """
-    claims_a = set(a.identity_claims)
-    claims_b = set(b.identity_claims)
     return sorted(claims_a & claims_b)
 
 
@@ -451,21 +571,20 @@ def _similarity_verdict(score: float) -> str:
     return "INCONCLUSIVE"
 
 
-def _names_match(requested: str, claimed: str) -> bool:
+def _names_match(requested_parts: set[str], claimed: str) -> bool:
     """Check if a claimed model name plausibly matches the requested one.
 
     Args:
-        requested: The model name the user requested (lowercase).
+        requested_parts: Words of the requested model name, from ``_name_parts``.
         claimed: The model name the AI claimed to be (lowercase).
 
     Returns:
         True if names are a reasonable match.
     """
-    requested = requested.replace("-", " ").replace("_", " ")
-    claimed = claimed.replace("-", " ").replace("_", " ")
+    # Check if at least the base name overlaps (e.g., "claude" in both)
+    return not requested_parts.isdisjoint(_name_parts(claimed))
 
-    req_parts = set(requested.split())
-    claim_parts = set(claimed.split())
 
-    # Check if at least the base name overlaps (e.g., "claude" in both)
-    return bool(req_parts & claim_parts)
+def _name_parts(name: str) -> set[str]:
+    """Split a lowercase model name into words, treating - and _ as spaces."""
+    return set(name.translate(_NAME_SEPARATORS).split())
@@ -1,8 +1,8 @@
 """Test all suspect API models: Opus, Sonnet, Haiku."""
 
+import asyncio
 import httpx
-import json
-import time
+import orjson
 
 BASE = "http://127.0.0.1:8001"
 
@@ -13,14 +13,15 @@ MODELS = [
     ("Haiku 4.5", "claude-haiku-4-20250514"),
 ]
 
-print("=" * 80)
-print("LLM VERIFY — Testing all suspect models (opuscode.pro)")
-print("=" * 80)
 
-for display_name, model_id in MODELS:
-    print(f"\n{'─' * 80}")
-    print(f"  MODEL: {display_name} (requesting as: {model_id})")
-    print(f"{'─' * 80}")
+async def run_one(client, display_name, model_id):
+    """Run the identity suite against one model and return its report as a single block."""
+    lines = [
+        f"\n{'─' * 80}",
+        f"  MODEL: {display_name} (requesting as: {model_id})",
+        f"{'─' * 80}",
+    ]
+    out = lines.append
 
     payload = {
         "name": f"Suspect Test - {display_name}",
@@ -31,15 +32,15 @@ for display_name, model_id in MODELS:
     }
 
     try:
-        r = httpx.post(f"{BASE}/api/v1/benchmarks/", json=payload, timeout=300)
-        run = r.json()
+        r = await client.post(f"{BASE}/api/v1/benchmarks/", json=payload)
+        run = orjson.loads(r.content)
         run_id = run["id"]
         status = run["status"]
         count = run["result_count"]
-        print(f"  Status: {status} | Results: {count}")
+        out(f"  Status: {status} | Results: {count}")
 
         # Fetch results
-        results = httpx.get(f"{BASE}/api/v1/results/{run_id}").json()
+        results = orjson.loads((await client.get(f"{BASE}/api/v1/results/{run_id}")).content)
 
         for i, res in enumerate(results, 1):
             prompt_short = res["prompt_text"][:80]
@@ -47,25 +48,44 @@ for display_name, model_id in MODELS:
             latency = res["latency_ms"] or 0
             err = res["error_message"]
 
-            print(f"\n  Probe #{i}: {prompt_short}...")
+            out(f"\n  Probe #{i}: {prompt_short}...")
             if err:
-                print(f"  ERROR: {err[:150]}")
+                out(f"  ERROR: {err[:150]}")
             else:
-                print(f"  Response: {response}")
-            print(f"  Latency: {latency:.0f}ms | Tokens: in={res['prompt_tokens']} out={res['completion_tokens']}")
+                out(f"  Response: {response}")
+            out(f"  Latency: {latency:.0f}ms | Tokens: in={res['prompt_tokens']} out={res['completion_tokens']}")
 
         # Fingerprint
-        fp = httpx.get(f"{BASE}/api/v1/results/{run_id}/fingerprint?model_name={model_id}").json()
+        r = await client.get(f"{BASE}/api/v1/results/{run_id}/fingerprint?model_name={model_id}")
+        fp = orjson.loads(r.content)
         meta = fp.get("metadata", {})
         style = fp.get("style", {})
-        print(f"\n  FINGERPRINT:")
-        print(f"    Avg latency: {meta.get('avg_latency_ms', 0):.0f}ms")
-        print(f"    Avg length: {style.get('avg_char_length', 0):.0f} chars")
-        print(f"    Markdown usage: {style.get('uses_markdown', 0):.0%}")
-        print(f"    Errors: {meta.get('error_count', 0)}/{meta.get('total_results', 0)}")
+        out(f"\n  FINGERPRINT:")
+        out(f"    Avg latency: {meta.get('avg_latency_ms', 0):.0f}ms")
+        out(f"    Avg length: {style.get('avg_char_length', 0):.0f} chars")
+        out(f"    Markdown usage: {style.get('uses_markdown', 0):.0%}")
+        out(f"    Errors: {meta.get('error_count', 0)}/{meta.get('total_results', 0)}")
 
     except Exception as exc:
-        print(f"  FAILED: {exc}")
+        out(f"  FAILED: {exc}")
+
+    return "\n".join(lines)
+
+
+async def main():
+    # Models are tested concurrently; each report prints whole as soon as it
+    # finishes, so output from different models never interleaves.
+    async with httpx.AsyncClient(timeout=300) as client:
+        runs = [run_one(client, display_name, model_id) for display_name, model_id in MODELS]
+        for report in asyncio.as_completed(runs):
+            print(await report)
+
+
+print("=" * 80)
+print("LLM VERIFY — Testing all suspect models (opuscode.pro)")
+print("=" * 80)
+
+asyncio.run(main())
 
 print(f"\n{'=' * 80}")
 print("DONE — All models tested")
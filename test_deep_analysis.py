@@ -1,6 +1,9 @@
-"""Run capability + fingerprint suites one model at a time."""
+"""Run capability + fingerprint suites for every model concurrently."""
+
+import asyncio
 
 import httpx
+import orjson
 
 BASE = "http://127.0.0.1:8001"
 
@@ -13,10 +16,14 @@ MODELS = [
 SUITES = ["capability", "fingerprint"]
 
 
-def run_one(suite, display_name, model_id):
-    print(f"\n{'─' * 80}")
-    print(f"  {suite.upper()} | {display_name} ({model_id})")
-    print(f"{'─' * 80}")
+async def run_one(client, suite, display_name, model_id):
+    """Run one suite against one model and return its report as a single block."""
+    lines = [
+        f"\n{'─' * 80}",
+        f"  {suite.upper()} | {display_name} ({model_id})",
+        f"{'─' * 80}",
+    ]
+    out = lines.append
 
     payload = {
         "name": f"{suite.title()} - {display_name}",
@@ -24,50 +31,68 @@ def run_one(suite, display_name, model_id):
         "model_configs": [{"model_name": model_id, "provider": "suspect"}],
     }
 
-    r = httpx.post(f"{BASE}/api/v1/benchmarks/", json=payload, timeout=None)
-    run = r.json()
-    run_id = run["id"]
-    print(f"  Status: {run['status']} | Results: {run['result_count']}")
-
-    results = httpx.get(f"{BASE}/api/v1/results/{run_id}").json()
-    for i, res in enumerate(results, 1):
-        prompt_short = res["prompt_text"][:90]
-        response = res["response_text"][:350] if res["response_text"] else "(empty)"
-        latency = res["latency_ms"] or 0
-        err = res["error_message"]
-
-        print(f"\n  #{i}: {prompt_short}...")
-        if err:
-            print(f"  ERROR: {err[:120]}")
-        else:
-            print(f"  >>> {response}")
-        print(f"  [{latency:.0f}ms | in={res['prompt_tokens']} out={res['completion_tokens']}]")
-
-    fp = httpx.get(f"{BASE}/api/v1/results/{run_id}/fingerprint", params={"model_name": model_id}).json()
-    meta = fp.get("metadata", {})
-    style = fp.get("style", {})
-    vocab = fp.get("vocabulary", {})
-    print(f"\n  ── FINGERPRINT ──")
-    print(f"  Avg latency:    {meta.get('avg_latency_ms', 0):.0f}ms")
-    print(f"  Avg length:     {style.get('avg_char_length', 0):.0f} chars / {style.get('avg_word_count', 0):.0f} words")
-    print(f"  Markdown:       {style.get('uses_markdown', 0):.0%}")
-    print(f"  Bullet lists:   {style.get('uses_bullet_lists', 0):.0%}")
-    print(f"  Code blocks:    {style.get('uses_code_blocks', 0):.0%}")
-    print(f"  Unique vocab:   {vocab.get('unique_ratio', 0):.1%}")
-    print(f"  Hedging ratio:  {vocab.get('hedging_ratio', 0):.1%}")
-    print(f"  Results/Errors: {meta.get('total_results', 0)}/{meta.get('error_count', 0)}")
+    try:
+        r = await client.post(f"{BASE}/api/v1/benchmarks/", json=payload)
+        run = orjson.loads(r.content)
+        run_id = run["id"]
+        out(f"  Status: {run['status']} | Results: {run['result_count']}")
+
+        results = orjson.loads((await client.get(f"{BASE}/api/v1/results/{run_id}")).content)
+        for i, res in enumerate(results, 1):
+            prompt_short = res["prompt_text"][:90]
+            response = res["response_text"][:350] if res["response_text"] else "(empty)"
+            latency = res["latency_ms"] or 0
+            err = res["error_message"]
+
+            out(f"\n  #{i}: {prompt_short}...")
+            if err:
+                out(f"  ERROR: {err[:120]}")
+            else:
+                out(f"  >>> {response}")
+            out(f"  [{latency:.0f}ms | in={res['prompt_tokens']} out={res['completion_tokens']}]")
+
+        r = await client.get(
+            f"{BASE}/api/v1/results/{run_id}/fingerprint", params={"model_name": model_id}
+        )
+        fp = orjson.loads(r.content)
+        meta = fp.get("metadata", {})
+        style = fp.get("style", {})
+        vocab = fp.get("vocabulary", {})
+        out(
+            f"\n  ── FINGERPRINT ──\n"
+            f"  Avg latency:    {meta.get('avg_latency_ms', 0):.0f}ms\n"
+            f"  Avg length:     {style.get('avg_char_length', 0):.0f} chars / {style.get('avg_word_count', 0):.0f} words\n"
+            f"  Markdown:       {style.get('uses_markdown', 0):.0%}\n"
+            f"  Bullet lists:   {style.get('uses_bullet_lists', 0):.0%}\n"
+            f"  Code blocks:    {style.get('uses_code_blocks', 0):.0%}\n"
+            f"  Unique vocab:   {vocab.get('unique_ratio', 0):.1%}\n"
+            f"  Hedging ratio:  {vocab.get('hedging_ratio', 0):.1%}\n"
+            f"  Results/Errors: {meta.get('total_results', 0)}/{meta.get('error_count', 0)}"
+        )
+    except Exception as exc:
+        out(f"  FAILED: {exc}")
+
+    return "\n".join(lines)
+
+
+async def main():
+    # Every suite/model run is independent, so fire them all at once and print
+    # each report whole as soon as it finishes, so output never interleaves.
+    async with httpx.AsyncClient(timeout=None) as client:
+        runs = [
+            run_one(client, suite, display_name, model_id)
+            for suite in SUITES
+            for display_name, model_id in MODELS
+        ]
+        for report in asyncio.as_completed(runs):
+            print(await report)
 
 
 print("=" * 80)
 print("LLM VERIFY — Deep Analysis (opuscode.pro)")
 print("=" * 80)
 
-for suite in SUITES:
-    for display_name, model_id in MODELS:
-        try:
-            run_one(suite, display_name, model_id)
-        except Exception as exc:
-            print(f"  FAILED: {exc}")
+asyncio.run(main())
 
 print(f"\n{'=' * 80}")
 print("DONE")
@@ -1,44 +1,47 @@
 """Shared test fixtures for the AI Benchmarker test suite."""
 
-import asyncio
 from collections.abc import AsyncGenerator
 
 import pytest
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 
 from src.database import Base
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create a single event loop for the entire test session."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
-
-
-@pytest_asyncio.fixture
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Create an in-memory SQLite database session for testing.
-
-    Each test gets a fresh database with all tables created.
-    The session is rolled back after each test for isolation.
-    """
+@pytest_asyncio.fixture(scope="session")
+async def db_engine() -> AsyncGenerator[AsyncEngine, None]:
+    """Create the in-memory SQLite engine and schema once for the whole session."""
     engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    yield engine
 
-    async with session_factory() as session:
-        yield session
+    await engine.dispose()
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
 
-    await engine.dispose()
+@pytest_asyncio.fixture
+async def db_session(db_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+    """Create a database session for testing.
+
+    The session is joined into an outer transaction that is rolled back after
+    each test, so every test starts from an empty schema. Commits made by the
+    code under test only release a SAVEPOINT inside that transaction.
+    """
+    async with db_engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+
+        yield session
+
+        await session.close()
+        await transaction.rollback()
 
 
 @pytest.fixture
@@ -0,0 +1,60 @@
+"""Tests for the adapter factory."""
+
+import pytest
+
+from src.adapters.anthropic_adapter import AnthropicAdapter
+from src.adapters.factory import create_adapter
+from src.adapters.openai_adapter import OpenAIAdapter
+from src.schemas.result import ModelConfig
+
+
+def test_create_adapter_suspect_defaults_to_anthropic_protocol():
+    """Suspect providers should speak the Anthropic Messages protocol by default."""
+    config = ModelConfig(
+        model_name="Opus 4.6",
+        provider="suspect",
+        api_key="key",
+        api_base_url="https://suspect.example.com/api",
+    )
+    adapter = create_adapter(config)
+
+    assert isinstance(adapter, AnthropicAdapter)
+    assert adapter.api_base_url == "https://suspect.example.com/api"
+
+
+def test_create_adapter_protocol_override_selects_anthropic():
+    """An explicit protocol should override the provider default."""
+    config = ModelConfig(
+        model_name="test-model",
+        provider="generic",
+        api_key="key",
+        api_base_url="https://api.example.com",
+        protocol="anthropic",
+    )
+
+    assert isinstance(create_adapter(config), AnthropicAdapter)
+
+
+def test_create_adapter_generic_provider_defaults_to_openai_protocol():
+    """Generic providers should default to the OpenAI Chat Completions protocol."""
+    config = ModelConfig(
+        model_name="test-model",
+        provider="generic",
+        api_key="key",
+        api_base_url="https://api.example.com/v1",
+    )
+
+    assert isinstance(create_adapter(config), OpenAIAdapter)
+
+
+def test_create_adapter_unknown_protocol_raises_error():
+    """An unregistered protocol should raise ValueError."""
+    config = ModelConfig.model_construct(
+        model_name="test-model",
+        provider="generic",
+        api_key="key",
+        api_base_url="https://api.example.com/v1",
+        protocol="grpc",
+    )
+    with pytest.raises(ValueError, match="Unknown protocol"):
+        create_adapter(config)
@@ -1,7 +1,11 @@
 """Tests for the generic (OpenAI-compatible) adapter."""
 
+from unittest.mock import AsyncMock, patch
+
+import httpx
 import pytest
 
+from src.adapters.base import CompletionResponse, close_shared_clients
 from src.adapters.generic_adapter import GenericAdapter
 
 
@@ -30,3 +34,78 @@ def test_generic_adapter_strips_trailing_slash():
         api_base_url="https://api.example.com/v1/",
     )
     assert adapter.api_base_url == "https://api.example.com/v1"
+
+
+@pytest.mark.asyncio
+async def test_generic_adapters_same_endpoint_share_client():
+    """Adapters for the same endpoint should reuse one pooled client, even across keys."""
+    first = GenericAdapter(model_name="a", api_key="key", api_base_url="https://api.example.com/v1")
+    second = GenericAdapter(
+        model_name="b", api_key="other", api_base_url="https://api.example.com/v1"
+    )
+    other = GenericAdapter(
+        model_name="a", api_key="key", api_base_url="https://other.example.com/v1"
+    )
+
+    try:
+        assert await first._get_client() is await second._get_client()
+        assert await first._get_client() is not await other._get_client()
+    finally:
+        await close_shared_clients()
+
+
+@pytest.mark.asyncio
+async def test_generic_adapter_http_error_returns_error_response():
+    """A 4xx/5xx reply should become an error CompletionResponse with latency."""
+    adapter = GenericAdapter(
+        model_name="test", api_key="key", api_base_url="https://api.example.com/v1"
+    )
+    transport = httpx.MockTransport(lambda request: httpx.Response(503, text="overloaded"))
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        with patch.object(adapter, "_get_client", AsyncMock(return_value=client)):
+            response = await adapter.complete("hello")
+
+    assert response.is_error
+    assert response.error == "HTTP 503: overloaded"
+    assert response.latency_ms is not None
+
+
+@pytest.mark.asyncio
+async def test_generic_adapter_parses_successful_completion():
+    """A 200 reply should be parsed into text and token usage."""
+    adapter = GenericAdapter(
+        model_name="test", api_key="key", api_base_url="https://api.example.com/v1"
+    )
+    body = {
+        "choices": [{"message": {"content": "I am a test model."}}],
+        "usage": {"prompt_tokens": 5, "completion_tokens": 6, "total_tokens": 11},
+    }
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=body))
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        with patch.object(adapter, "_get_client", AsyncMock(return_value=client)):
+            response = await adapter.complete("hello")
+
+    assert not response.is_error
+    assert response.text == "I am a test model."
+    assert response.total_tokens == 11
+
+
+@pytest.mark.asyncio
+async def test_generic_adapter_batch_complete_preserves_order_and_isolates_errors():
+    """batch_complete should return responses in prompt order, turning raises into errors."""
+    adapter = GenericAdapter(
+        model_name="test", api_key="key", api_base_url="https://api.example.com/v1"
+    )
+
+    async def _fake_complete(prompt: str, system_prompt: str = "") -> CompletionResponse:
+        if prompt == "boom":
+            raise RuntimeError("unexpected payload")
+        return CompletionResponse(text=prompt.upper())
+
+    with patch.object(adapter, "complete", side_effect=_fake_complete):
+        responses = await adapter.batch_complete(["a", "boom", "c"], max_in_flight=2)
+
+    assert [r.text for r in responses] == ["A", "", "C"]
+    assert responses[1].error == "unexpected payload"
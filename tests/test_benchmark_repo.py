@@ -0,0 +1,143 @@
+"""Tests for the benchmark run repository."""
+
+import uuid
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+
+from src.repositories.benchmark_repo import BenchmarkRepository
+from src.repositories.result_repo import ResultRepository
+
+
+def _result_row(run_id: uuid.UUID, index: int) -> dict[str, object]:
+    """Build a minimal result row for bulk insertion."""
+    return {
+        "benchmark_run_id": run_id,
+        "model_name": "test-model",
+        "provider": "generic",
+        "api_base_url": "https://test.com/v1",
+        "prompt_category": "identity",
+        "prompt_text": f"Test prompt {index}",
+        "response_text": "ok",
+    }
+
+
+@pytest.mark.asyncio
+async def test_list_with_result_counts_counts_without_loading_results(db_session):
+    """Each run should be paired with its own result count, newest first."""
+    bench_repo = BenchmarkRepository(db_session)
+    result_repo = ResultRepository(db_session)
+
+    empty_run = await bench_repo.create("Empty", "", "identity")
+    full_run = await bench_repo.create("Full", "", "identity")
+    await result_repo.create_many([_result_row(full_run.id, i) for i in range(3)])
+
+    counts = {run.id: count for run, count in await bench_repo.list_with_result_counts()}
+
+    assert counts == {empty_run.id: 0, full_run.id: 3}
+
+
+@pytest.mark.asyncio
+async def test_update_status_updates_existing_run_only(db_session):
+    """update_status should change the stored run and report unknown IDs."""
+    bench_repo = BenchmarkRepository(db_session)
+    run = await bench_repo.create("Status", "", "identity")
+
+    assert await bench_repo.update_status(run.id, "running") is True
+    assert await bench_repo.update_status(uuid.uuid4(), "running") is False
+
+    stored = await bench_repo.get_by_id(run.id)
+    assert stored is not None
+    assert stored.status == "running"
+
+
+@pytest.mark.asyncio
+async def test_create_many_issues_single_executemany_without_returning(db_session):
+    """create_many should send every row in one executemany INSERT with no RETURNING."""
+    run = await BenchmarkRepository(db_session).create("Bulk", "", "identity")
+    await db_session.flush()
+    statements: list[tuple[str, bool]] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, executemany))
+
+    sync_engine = db_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _record)
+    try:
+        stored = await ResultRepository(db_session).create_many(
+            [_result_row(run.id, i) for i in range(5)]
+        )
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", _record)
+
+    assert stored == 5
+    assert len(statements) == 1
+    statement, executemany = statements[0]
+    assert statement.startswith("INSERT INTO benchmark_results")
+    assert "RETURNING" not in statement
+    assert executemany is True
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_loads_results_only_on_request(db_session):
+    """Results should be eager-loaded only with include_results; lazy access raises."""
+    bench_repo = BenchmarkRepository(db_session)
+    run_id = (await bench_repo.create("Meta", "", "identity")).id
+    await ResultRepository(db_session).create_many([_result_row(run_id, i) for i in range(2)])
+    db_session.expire_all()
+
+    meta = await bench_repo.get_by_id(run_id)
+    assert meta is not None
+    with pytest.raises(InvalidRequestError):
+        _ = meta.results
+
+    full = await bench_repo.get_by_id(run_id, include_results=True)
+    assert full is not None
+    assert len(full.results) == 2
+    assert await bench_repo.get_with_result_count(run_id) == (full, 2)
+    assert await bench_repo.get_with_result_count(uuid.uuid4()) is None
+
+
+@pytest.mark.asyncio
+async def test_get_by_run_ids_fetches_only_requested_runs(db_session):
+    """get_by_run_ids should return every row of the given runs and nothing else."""
+    bench_repo = BenchmarkRepository(db_session)
+    result_repo = ResultRepository(db_session)
+    runs = [await bench_repo.create(f"Run {i}", "", "identity") for i in range(3)]
+    await result_repo.create_many([_result_row(run.id, i) for run in runs for i in range(2)])
+
+    fetched = await result_repo.get_by_run_ids([runs[0].id, runs[2].id])
+
+    assert len(fetched) == 4
+    assert {r.benchmark_run_id for r in fetched} == {runs[0].id, runs[2].id}
+    assert await result_repo.get_by_run_ids([]) == []
+
+
+@pytest.mark.asyncio
+async def test_get_stats_by_run_ids_aggregates_in_the_database(db_session):
+    """get_stats_by_run_ids should skip missing values and count only real errors."""
+    bench_repo = BenchmarkRepository(db_session)
+    result_repo = ResultRepository(db_session)
+    run = await bench_repo.create("Stats", "", "identity")
+    other_run = await bench_repo.create("Other", "", "identity")
+    rows = [_result_row(run.id, i) for i in range(4)]
+    rows[0].update(response_text="abcd", latency_ms=100.0, total_tokens=10)
+    rows[1].update(response_text="ab", latency_ms=300.0, total_tokens=None)
+    rows[2].update(response_text="", latency_ms=None, total_tokens=30, error_message="boom")
+    rows[3].update(response_text="abc", latency_ms=None, total_tokens=None, error_message="")
+    await result_repo.create_many([*rows, _result_row(other_run.id, 9)])
+
+    missing_id = uuid.uuid4()
+    stats_by_run = await result_repo.get_stats_by_run_ids([run.id, other_run.id, missing_id])
+
+    assert set(stats_by_run) == {run.id, other_run.id}
+    stats = stats_by_run[run.id]
+    assert stats.result_count == 4
+    assert stats.avg_latency_ms == pytest.approx(200.0)
+    assert stats.avg_response_length == pytest.approx(3.0)
+    assert stats.avg_total_tokens == pytest.approx(20.0)
+    assert stats.error_count == 1
+    assert stats_by_run[other_run.id].result_count == 1
+    assert stats_by_run[other_run.id].avg_latency_ms is None
+    assert await result_repo.get_stats_by_run_ids([]) == {}
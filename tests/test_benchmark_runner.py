@@ -1,12 +1,23 @@
 """Tests for the benchmark runner service."""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from src.adapters.base import CompletionResponse
-from src.schemas.benchmark import BenchmarkRunCreate
-from src.services.benchmark_runner import BenchmarkRunnerService
+from src.adapters.generic_adapter import GenericAdapter
+from src.prompts import IDENTITY_PROMPTS
+from src.repositories.benchmark_repo import BenchmarkRepository
+from src.repositories.result_repo import ResultRepository
+from src.schemas.benchmark import (
+    BenchmarkRunCreate,
+    BenchmarkRunResponse,
+    BenchmarkRunStatus,
+    PromptSuite,
+)
+from src.schemas.result import ModelConfig
+from src.services.benchmark_runner import BenchmarkRunnerService, build_run_response
 
 
 @pytest.mark.asyncio
@@ -100,6 +111,174 @@ async def test_run_benchmark_invalid_suite_fails(db_session):
         ],
     )
 
-    with patch("src.services.benchmark_runner.PROMPT_SUITES", {"identity": []}):
+    with patch("src.services.benchmark_runner.PROMPT_SUITES", {"identity": ()}):
         result = await service.run_benchmark(request)
         assert result.status == "failed"
+
+
+@pytest.mark.asyncio
+async def test_run_benchmark_persists_one_row_per_prompt(db_session):
+    """Every prompt/model pair should be written as its own result row."""
+    mock_response = CompletionResponse(text="I am a test model.", latency_ms=120.0)
+
+    def _fake_adapter(config: ModelConfig) -> GenericAdapter:
+        adapter = GenericAdapter(config.model_name, api_base_url=config.api_base_url)
+        adapter.complete = AsyncMock(return_value=mock_response)
+        return adapter
+
+    with patch("src.services.benchmark_runner.create_adapter", side_effect=_fake_adapter):
+        service = BenchmarkRunnerService(db_session, max_concurrent=2)
+        result = await service.run_benchmark(
+            BenchmarkRunCreate(
+                name="Bulk Write",
+                prompt_suite="identity",
+                model_configs=[
+                    {
+                        "model_name": "model-a",
+                        "provider": "generic",
+                        "api_base_url": "https://a.com/v1",
+                    },
+                    {
+                        "model_name": "model-b",
+                        "provider": "generic",
+                        "api_base_url": "https://b.com/v1",
+                    },
+                ],
+            )
+        )
+
+    stored = await ResultRepository(db_session).get_by_run_id(result.id)
+    assert result.result_count == 2 * len(IDENTITY_PROMPTS)
+    assert len(stored) == result.result_count
+    assert len({r.id for r in stored}) == len(stored)
+    assert {r.model_name for r in stored} == {"model-a", "model-b"}
+
+
+@pytest.mark.asyncio
+async def test_run_benchmark_reuses_cached_responses_when_requested(db_session):
+    """A re-run with reuse_cached_responses should not call the model again."""
+    mock_response = CompletionResponse(text="I am a cached model.", latency_ms=80.0)
+    complete = AsyncMock(return_value=mock_response)
+
+    def _fake_adapter(config: ModelConfig) -> GenericAdapter:
+        adapter = GenericAdapter(config.model_name, api_base_url=config.api_base_url)
+        adapter.complete = complete
+        return adapter
+
+    request = BenchmarkRunCreate(
+        name="Cached",
+        prompt_suite="identity",
+        model_configs=[
+            {
+                "model_name": "cache-model",
+                "provider": "generic",
+                "api_base_url": "https://c.com/v1",
+            },
+        ],
+        reuse_cached_responses=True,
+    )
+    with (
+        patch("src.services.benchmark_runner._RESPONSE_CACHE", {}),
+        patch("src.services.benchmark_runner.create_adapter", side_effect=_fake_adapter),
+    ):
+        service = BenchmarkRunnerService(db_session, max_concurrent=2)
+        first = await service.run_benchmark(request)
+        second = await service.run_benchmark(request)
+
+    assert complete.await_count == len(IDENTITY_PROMPTS)
+    assert first.result_count == second.result_count == len(IDENTITY_PROMPTS)
+    result_repo = ResultRepository(db_session)
+    assert {r.latency_ms for r in await result_repo.get_by_run_id(first.id)} == {80.0}
+    stored = await result_repo.get_by_run_id(second.id)
+    assert {r.response_text for r in stored} == {"I am a cached model."}
+    # Replayed answers were not timed in the re-run, so no latency is persisted
+    assert {r.latency_ms for r in stored} == {None}
+
+
+@pytest.mark.asyncio
+async def test_response_cache_is_scoped_to_the_api_key(db_session):
+    """A different account on the same endpoint and model must not reuse answers."""
+    complete = AsyncMock(return_value=CompletionResponse(text="Hello.", latency_ms=50.0))
+
+    def _fake_adapter(config: ModelConfig) -> GenericAdapter:
+        adapter = GenericAdapter(
+            config.model_name, api_key=config.api_key, api_base_url=config.api_base_url
+        )
+        adapter.complete = complete
+        return adapter
+
+    def _request(api_key: str) -> BenchmarkRunCreate:
+        return BenchmarkRunCreate(
+            name="Scoped",
+            prompt_suite="identity",
+            model_configs=[
+                {
+                    "model_name": "cache-model",
+                    "provider": "generic",
+                    "api_key": api_key,
+                    "api_base_url": "https://c.com/v1",
+                },
+            ],
+            reuse_cached_responses=True,
+        )
+
+    with (
+        patch("src.services.benchmark_runner._RESPONSE_CACHE", {}),
+        patch("src.services.benchmark_runner.create_adapter", side_effect=_fake_adapter),
+    ):
+        service = BenchmarkRunnerService(db_session, max_concurrent=2)
+        await service.run_benchmark(_request("key-a"))
+        await service.run_benchmark(_request("key-b"))
+
+    assert complete.await_count == 2 * len(IDENTITY_PROMPTS)
+
+
+@pytest.mark.asyncio
+async def test_build_run_response_skips_validation_but_serializes(db_session):
+    """The trusted builder should yield enum-typed fields that dump like a validated model."""
+    run = await BenchmarkRepository(db_session).create("Trusted", "desc", "identity")
+    await db_session.flush()
+
+    response = build_run_response(run, result_count=3)
+
+    assert response.status is BenchmarkRunStatus.PENDING
+    assert response.prompt_suite is PromptSuite.IDENTITY
+    assert (
+        response.model_dump_json()
+        == BenchmarkRunResponse.model_validate(response.model_dump()).model_dump_json()
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_benchmark_keeps_full_concurrency_budget_in_use(db_session):
+    """With fewer models than slots, requests in flight should still reach max_concurrent."""
+    in_flight = 0
+    peak = 0
+
+    async def _slow_complete(prompt: str, system_prompt: str = "") -> CompletionResponse:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return CompletionResponse(text="ok", latency_ms=10.0)
+
+    def _fake_adapter(config: ModelConfig) -> GenericAdapter:
+        adapter = GenericAdapter(config.model_name, api_base_url=config.api_base_url)
+        adapter.complete = _slow_complete
+        return adapter
+
+    request = BenchmarkRunCreate(
+        name="Budget",
+        prompt_suite="identity",
+        model_configs=[
+            {"model_name": f"model-{i}", "provider": "generic", "api_base_url": "https://b.com/v1"}
+            for i in range(3)
+        ],
+    )
+    with patch("src.services.benchmark_runner.create_adapter", side_effect=_fake_adapter):
+        service = BenchmarkRunnerService(db_session, max_concurrent=5)
+        response = await service.run_benchmark(request)
+
+    assert response.result_count == 3 * len(IDENTITY_PROMPTS)
+    assert peak == 5
@@ -0,0 +1,29 @@
+"""Tests for the startup schema check."""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.database import OutdatedSchemaError, verify_schema
+
+
+@pytest.mark.asyncio
+async def test_verify_schema_accepts_current_schema(db_engine):
+    """A database built from the current models should pass the check."""
+    async with db_engine.connect() as conn:
+        await conn.run_sync(verify_schema)
+
+
+@pytest.mark.asyncio
+async def test_verify_schema_refuses_string_ids():
+    """A database still using String(36) run ids should be refused."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(
+                text("CREATE TABLE benchmark_runs (id VARCHAR(36) NOT NULL PRIMARY KEY)")
+            )
+            with pytest.raises(OutdatedSchemaError, match="alembic upgrade head"):
+                await conn.run_sync(verify_schema)
+    finally:
+        await engine.dispose()
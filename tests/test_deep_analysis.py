@@ -0,0 +1,93 @@
+"""Tests for the deep analysis service."""
+
+import uuid
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.adapters.base import CompletionResponse
+from src.adapters.generic_adapter import GenericAdapter
+from src.database import Base, get_session_factory
+from src.main import app
+from src.prompts import CAPABILITY_PROMPTS, IDENTITY_PROMPTS
+from src.repositories.result_repo import ResultRepository
+from src.schemas.analysis import DeepAnalysisRequest
+from src.schemas.result import ModelConfig
+from src.services.deep_analysis import DeepAnalysisService
+
+
+@pytest_asyncio.fixture
+async def session_factory(
+    tmp_path: Path,
+) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    """File-backed database factory: suite runs use separate sessions, so they need
+    a database shared across connections."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'deep.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    await engine.dispose()
+
+
+def _fake_adapter(config: ModelConfig) -> GenericAdapter:
+    adapter = GenericAdapter(config.model_name, api_base_url=config.api_base_url)
+    adapter.complete = AsyncMock(
+        return_value=CompletionResponse(text=f"I am {config.model_name}.", latency_ms=50.0)
+    )
+    return adapter
+
+
+@pytest.mark.asyncio
+async def test_analyze_runs_every_model_suite_pair_in_own_session(session_factory):
+    """Each model should get one stored run per suite, with its results in the report."""
+    request = DeepAnalysisRequest(
+        model_configs=[
+            {"model_name": "model-a", "provider": "generic", "api_base_url": "https://a.com/v1"},
+            {"model_name": "model-b", "provider": "generic", "api_base_url": "https://b.com/v1"},
+        ],
+        suites=["identity", "capability", "unknown"],
+    )
+    with patch("src.services.benchmark_runner.create_adapter", side_effect=_fake_adapter):
+        report = await DeepAnalysisService(session_factory, max_concurrent=3).analyze(request)
+
+    assert [r.model_name for r in report.model_reports] == ["model-a", "model-b"]
+    for model_report in report.model_reports:
+        assert set(model_report.benchmark_run_ids) == {"identity", "capability"}
+        assert model_report.total_probes == len(IDENTITY_PROMPTS) + len(CAPABILITY_PROMPTS)
+        assert model_report.errors == 0
+    run_ids = [i for r in report.model_reports for i in r.benchmark_run_ids.values()]
+    assert len(set(run_ids)) == 4
+
+
+@pytest.mark.asyncio
+async def test_deep_analysis_route_uses_injected_session_factory(session_factory):
+    """The route should store its runs through the overridable session factory."""
+    payload = {
+        "model_configs": [
+            {"model_name": "model-a", "provider": "generic", "api_base_url": "https://a.com/v1"},
+        ],
+        "suites": ["identity"],
+    }
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
+    try:
+        transport = httpx.ASGITransport(app=app)
+        with patch("src.services.benchmark_runner.create_adapter", side_effect=_fake_adapter):
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.post("/api/v1/analysis/deep", json=payload)
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    (model_report,) = response.json()["model_reports"]
+    assert model_report["total_probes"] == len(IDENTITY_PROMPTS)
+    run_id = uuid.UUID(model_report["benchmark_run_ids"]["identity"])
+    async with session_factory() as session:
+        stored = await ResultRepository(session).get_by_run_ids([run_id])
+    assert len(stored) == len(IDENTITY_PROMPTS)
@@ -0,0 +1,49 @@
+"""Tests for the fingerprint service."""
+
+from src.models.result import BenchmarkResult
+from src.services.fingerprint import FingerprintService
+
+
+def _result(text: str, error: str | None = None, latency: float | None = 100.0) -> BenchmarkResult:
+    """Build an unsaved result carrying only the fields the fingerprint reads."""
+    return BenchmarkResult(
+        response_text=text,
+        error_message=error,
+        latency_ms=latency,
+        total_tokens=None,
+    )
+
+
+def test_generate_fingerprint_counts_style_vocabulary_and_structure():
+    """Each metric should reflect the valid responses only."""
+    results = [
+        _result("Hello! Perhaps this helps.\n\n- one\n- two\n\nLet me know!"),
+        _result("1. First\n2. Second\n```py\nx = 1\n```", latency=300.0),
+        _result("Certainly wrong", error="HTTP 500"),
+    ]
+
+    fingerprint = FingerprintService().generate_fingerprint(results)
+
+    style = fingerprint["style"]
+    assert style["uses_bullet_lists"] == 0.5
+    assert style["uses_numbered_lists"] == 0.5
+    assert style["uses_code_blocks"] == 0.5
+    assert fingerprint["vocabulary"]["hedging_ratio"] == 0.5
+    assert fingerprint["vocabulary"]["confidence_ratio"] == 0.0
+    assert fingerprint["structure"]["starts_with_greeting_ratio"] == 0.5
+    assert fingerprint["structure"]["ends_with_offer_ratio"] == 0.5
+    assert fingerprint["metadata"] == {
+        "avg_latency_ms": 200.0,
+        "avg_tokens": None,
+        "total_results": 2,
+        "error_count": 0,
+    }
+
+
+def test_generate_fingerprint_without_valid_results_reports_error():
+    """Only errored or empty responses should yield an error fingerprint."""
+    results = [_result("", latency=None), _result("text", error="timeout")]
+
+    assert FingerprintService().generate_fingerprint(results) == {
+        "error": "No valid results to fingerprint"
+    }
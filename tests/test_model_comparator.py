@@ -1,8 +1,9 @@
 """Tests for the model comparator service."""
 
+import uuid
+
 import pytest
 
-from src.models.result import BenchmarkResult
 from src.repositories.result_repo import ResultRepository
 from src.schemas.result import ComparisonRequest
 from src.services.model_comparator import ModelComparatorService
@@ -10,30 +11,33 @@ from src.services.model_comparator import ModelComparatorService
 
 async def _create_results(
     repo: ResultRepository,
-    run_id: str,
+    run_id: uuid.UUID,
     model_name: str,
     count: int = 5,
     latency_base: float = 200.0,
     response_length: int = 500,
     error_count: int = 0,
 ) -> None:
-    """Helper to create mock benchmark results for testing."""
-    for i in range(count):
-        is_error = i < error_count
-        await repo.create(
-            benchmark_run_id=run_id,
-            model_name=model_name,
-            provider="generic",
-            api_base_url="https://test.com/v1",
-            prompt_category="identity",
-            prompt_text=f"Test prompt {i}",
-            response_text="" if is_error else "x" * response_length,
-            error_message="Error" if is_error else None,
-            latency_ms=latency_base + (i * 10),
-            prompt_tokens=50,
-            completion_tokens=100,
-            total_tokens=150,
-        )
+    """Helper to create mock benchmark results for testing in one bulk insert."""
+    await repo.create_many(
+        [
+            {
+                "benchmark_run_id": run_id,
+                "model_name": model_name,
+                "provider": "generic",
+                "api_base_url": "https://test.com/v1",
+                "prompt_category": "identity",
+                "prompt_text": f"Test prompt {i}",
+                "response_text": "" if i < error_count else "x" * response_length,
+                "error_message": "Error" if i < error_count else None,
+                "latency_ms": latency_base + (i * 10),
+                "prompt_tokens": 50,
+                "completion_tokens": 100,
+                "total_tokens": 150,
+            }
+            for i in range(count)
+        ]
+    )
 
 
 @pytest.mark.asyncio
@@ -96,7 +100,26 @@ async def test_compare_empty_runs_returns_inconclusive(db_session):
     """Runs with no results should return INCONCLUSIVE."""
     comparator = ModelComparatorService(db_session)
     score = await comparator.compare(
-        ComparisonRequest(baseline_run_id="nonexistent-1", suspect_run_id="nonexistent-2")
+        ComparisonRequest(baseline_run_id=uuid.uuid4(), suspect_run_id=uuid.uuid4())
+    )
+
+    assert score.verdict == "INCONCLUSIVE"
+
+
+@pytest.mark.asyncio
+async def test_compare_one_empty_run_skips_dimensions(db_session):
+    """A run with results compared against an empty run should short-circuit."""
+    from src.repositories.benchmark_repo import BenchmarkRepository
+
+    bench_repo = BenchmarkRepository(db_session)
+    run = await bench_repo.create("Baseline", "", "identity")
+    empty_run = await bench_repo.create("Suspect", "", "identity")
+    await _create_results(ResultRepository(db_session), run.id, "gpt-4o")
+
+    comparator = ModelComparatorService(db_session)
+    score = await comparator.compare(
+        ComparisonRequest(baseline_run_id=run.id, suspect_run_id=empty_run.id)
     )
 
     assert score.verdict == "INCONCLUSIVE"
+    assert score.dimensions == {}
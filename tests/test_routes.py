@@ -0,0 +1,20 @@
+"""Tests for application-level route configuration."""
+
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.routing import APIRoute
+
+from src.main import app
+
+
+def test_routes_use_pydantic_json_fast_path():
+    """Every route should serialize through its response model straight to JSON bytes.
+
+    FastAPI only takes that path when a route has a response field and no
+    custom response class (such as ORJSONResponse) has been set.
+    """
+    routes = [route for route in app.routes if isinstance(route, APIRoute)]
+
+    assert routes
+    for route in routes:
+        assert route.response_field is not None, route.path
+        assert isinstance(route.response_class, DefaultPlaceholder), route.path
@@ -1,14 +1,14 @@
 """Quick script to view benchmark results."""
 
 import httpx
-import json
+import orjson
 import sys
 
 RUN_ID = sys.argv[1] if len(sys.argv) > 1 else "5f633956-040d-40e6-bd17-3b47be57f9a8"
 BASE = "http://127.0.0.1:8001"
 
 r = httpx.get(f"{BASE}/api/v1/results/{RUN_ID}")
-results = r.json()
+results = orjson.loads(r.content)
 
 for i, res in enumerate(results, 1):
     sep = "=" * 80